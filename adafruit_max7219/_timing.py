@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_max7219._timing`
+====================================================
+Fixed rate scheduling for the ``update`` methods called from a main loop.
+"""
+
+import time
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MAX7219.git"
+
+
+class Ticker:
+    """
+    Tells when the next of a series of evenly spaced steps is due.
+
+    Deadlines are kept as integer nanoseconds, floats lose too much precision
+    after a few days of uptime on CircuitPython.
+    """
+
+    def __init__(self):
+        self._next = time.monotonic_ns()
+
+    def restart(self) -> None:
+        """
+        Make the next step due right away.
+        """
+        self._next = time.monotonic_ns()
+
+    def due(self, interval_ns: int) -> bool:
+        """
+        Check whether the next step is due, and if so schedule the one after it.
+
+        :param int interval_ns: nanoseconds between steps
+        :return: True if a step should be taken now
+        :rtype: bool
+        """
+        now = time.monotonic_ns()
+        if now < self._next:
+            return False
+        self._next += interval_ns
+        if self._next < now:
+            # fell behind, don't try to catch up with a burst of steps
+            self._next = now + interval_ns
+        return True
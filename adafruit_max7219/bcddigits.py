@@ -7,13 +7,11 @@
 ====================================================
 """
 
-from micropython import const
-
 from adafruit_max7219 import max7219
 
 try:
     # Used only for typing
-    from typing import List
+    from typing import List, Optional
 
     import busio
     import digitalio
@@ -23,11 +21,6 @@ except ImportError:
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MAX7219.git"
 
-_DECODEMODE = const(9)
-_SCANLIMIT = const(11)
-_SHUTDOWN = const(12)
-_DISPLAYTEST = const(15)
-
 
 class BCDDigits(max7219.MAX7219):
     """
@@ -37,25 +30,57 @@ class BCDDigits(max7219.MAX7219):
     :param ~busio.SPI spi: an spi busio or spi bitbangio object
     :param ~digitalio.DigitalInOut cs: digital in/out to use as chip select signal
     :param int nDigits: number of led 7-segment digits; default 1; max 8
+    :param transport: sends the bytes to the chip, replaces ``spi`` and ``cs``
+      (default `adafruit_max7219.transports.SPIDeviceTransport`)
     """
 
-    def __init__(self, spi: busio.SPI, cs: digitalio.DigitalInOut, nDigits: int = 1):
+    def __init__(
+        self,
+        spi: busio.SPI,
+        cs: digitalio.DigitalInOut,
+        nDigits: int = 1,
+        *,
+        transport: Optional[object] = None,
+    ):
         self._ndigits = nDigits
-        super().__init__(self._ndigits, 8, spi, cs)
+        self._decode_mode = (2**self._ndigits) - 1
+        super().__init__(self._ndigits, 8, spi, cs, transport=transport)
+        # an all zero buffer would show zeros, start out blank instead
+        self.clear_all()
 
     def init_display(self) -> None:
-        for cmd, data in (
-            (_SHUTDOWN, 0),
-            (_DISPLAYTEST, 0),
-            (_SCANLIMIT, 7),
-            (_DECODEMODE, (2**self._ndigits) - 1),
-            (_SHUTDOWN, 1),
-        ):
-            self.write_cmd(cmd, data)
-
+        self._configure()
         self.clear_all()
         self.show()
 
+    def fill(self, bit_value: int) -> None:
+        """
+        Fill the display buffer.
+
+        :param int bit_value: value > 0 set the buffer bit, else clears the buffer bit
+        """
+        # BCDDigits works on the buffer directly and never needs adafruit_framebuf
+        value = 0xFF if bit_value else 0x00
+        for i in range(self._ndigits):
+            self._buffer[i] = value
+        self._dirty = 0xFF
+
+    def pixel(self, xpos: int, ypos: int, bit_value: int = None) -> None:
+        """
+        Set one buffer bit
+
+        :param int xpos: x position to set bit
+        :param int ypos: y position to set bit
+        :param int bit_value: value > 0 sets the buffer bit, else clears the buffer bit
+        """
+        if 0 <= xpos < self._ndigits and 0 <= ypos < 8:
+            if bit_value:
+                self._buffer[xpos] |= 1 << ypos
+            else:
+                self._buffer[xpos] &= ~(1 << ypos)
+            # each buffer byte is one digit register
+            self._dirty |= 1 << xpos
+
     def set_digit(self, dpos: int, value: int) -> None:
         """
         Display one digit.
@@ -0,0 +1,221 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_max7219.effects`
+====================================================
+Brightness fades and blinks driven through the intensity and shutdown registers.
+
+Every effect is compiled into a table of ready to send messages when it is started,
+so each step costs a single command (two bytes per chip) and the frame buffer is
+never redrawn or resent.
+"""
+
+from micropython import const
+
+from adafruit_max7219._timing import Ticker
+
+try:
+    # Used only for typing
+    from typing import List, Optional, Sequence
+
+    from adafruit_max7219.max7219 import MAX7219
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MAX7219.git"
+
+_INTENSITY = const(10)
+_SHUTDOWN = const(12)
+
+
+class IntensityEffects:
+    """
+    Fade and blink scheduler for a MAX7219 display or chain of displays.
+
+    Effects are started with `fade`, `fade_chips` or `blink` and then advanced
+    either one step at a time with `step`, or at a fixed rate by calling `update`
+    from the main loop.
+
+    :param ~adafruit_max7219.max7219.MAX7219 display: the display to drive
+    :param int brightness: the intensity the display is assumed to be at (default 15)
+    :param float gamma: gamma used to make fades look perceptually even (default 2.2)
+    :param float interval: seconds between steps when driven by `update` (default 0.02)
+    """
+
+    def __init__(
+        self,
+        display: MAX7219,
+        *,
+        brightness: int = 15,
+        gamma: float = 2.2,
+        interval: float = 0.02,
+    ):
+        self._display = display
+        self._chips = display.chain_length
+        self.gamma = gamma
+        self.interval = interval
+
+        _check_level(brightness)
+        self._levels = bytearray([brightness] * self._chips)
+        self._on = self._message(_SHUTDOWN, (1,) * self._chips)
+        self._off = self._message(_SHUTDOWN, (0,) * self._chips)
+        self._program = []
+        self._index = 0
+        self._ticker = Ticker()
+
+    def _message(self, cmd: int, values: Sequence[int]) -> bytearray:
+        buf = bytearray(2 * self._chips)
+        for chip, value in enumerate(values):
+            buf[2 * chip] = cmd
+            buf[2 * chip + 1] = value
+        return buf
+
+    def _curve(self, start: int, end: int, steps: int) -> bytearray:
+        """Gamma corrected intensity levels going from ``start`` to ``end``"""
+        inverse = 1 / self.gamma
+        low = (start / 15) ** inverse
+        high = (end / 15) ** inverse
+        curve = bytearray(steps)
+        for i in range(steps):
+            level = low + (high - low) * (i + 1) / steps
+            curve[i] = int(15 * level**self.gamma + 0.5)
+        return curve
+
+    def _start(self, program: List[Optional[memoryview]]) -> None:
+        self._program = program
+        self._index = 0
+        self._ticker.restart()
+
+    @property
+    def interval(self) -> float:
+        """Seconds between steps when driven by `update`."""
+        return self._interval_ns / 1000000000
+
+    @interval.setter
+    def interval(self, value: float) -> None:
+        self._interval_ns = int(value * 1000000000)
+
+    @property
+    def running(self) -> bool:
+        """True while an effect still has steps left to send."""
+        return self._index < len(self._program)
+
+    @property
+    def levels(self) -> bytearray:
+        """The intensity of each chip once the current effect has finished."""
+        return self._levels
+
+    def set_brightness(self, value: int, chip: int = None) -> None:
+        """
+        Immediately set the intensity of one chip, or of the whole chain.
+        Stops any running effect.
+
+        :param int value: 0->15 dimmest to brightest
+        :param int chip: chip position in transmit order, or None for every chip
+        """
+        _check_level(value)
+        if chip is None:
+            for i in range(self._chips):
+                self._levels[i] = value
+        else:
+            self._levels[chip] = value
+        self._start([])
+        self._display._write(self._message(_INTENSITY, self._levels))
+
+    def fade(self, start: int, end: int, steps: int) -> None:
+        """
+        Fade every chip from one intensity to another.
+
+        :param int start: 0->15 intensity at the start of the fade
+        :param int end: 0->15 intensity at the end of the fade
+        :param int steps: number of steps the fade takes
+        """
+        self.fade_chips((start,) * self._chips, (end,) * self._chips, steps)
+
+    def fade_chips(self, starts: Sequence[int], ends: Sequence[int], steps: int) -> None:
+        """
+        Fade each chip of a chain from its own start intensity to its own end intensity.
+
+        :param starts: 0->15 intensity of each chip at the start, in transmit order
+        :param ends: 0->15 intensity of each chip at the end, in transmit order
+        :param int steps: number of steps the fade takes
+        """
+        if len(starts) != self._chips or len(ends) != self._chips:
+            raise ValueError("Need one intensity per chip")
+        if steps < 1:
+            raise ValueError("Fade needs at least one step")
+        for value in starts:
+            _check_level(value)
+        for value in ends:
+            _check_level(value)
+
+        curves = [self._curve(starts[chip], ends[chip], steps) for chip in range(self._chips)]
+        size = 2 * self._chips
+        table = memoryview(bytearray(size * steps))
+        program = []
+        for i in range(steps):
+            message = table[i * size : (i + 1) * size]
+            changed = False
+            for chip in range(self._chips):
+                level = curves[chip][i]
+                message[2 * chip] = _INTENSITY
+                message[2 * chip + 1] = level
+                changed = changed or level != self._levels[chip]
+                self._levels[chip] = level
+            # steps that would not change any chip are skipped rather than resent
+            program.append(message if changed or not i else None)
+        self._start(program)
+
+    def blink(self, count: int, *, on_steps: int = 1, off_steps: int = 1) -> None:
+        """
+        Blink the display by toggling shutdown mode, the display data is left untouched.
+        The display is left on when the blinking ends.
+
+        :param int count: number of times to blink
+        :param int on_steps: number of steps the display stays on (default 1)
+        :param int off_steps: number of steps the display stays off (default 1)
+        """
+        cycle = [self._off] + [None] * (off_steps - 1) + [self._on] + [None] * (on_steps - 1)
+        self._start(cycle * count)
+
+    def step(self) -> bool:
+        """
+        Send the next step of the running effect.
+
+        :return: True if the effect has more steps left
+        :rtype: bool
+        """
+        if self._index >= len(self._program):
+            return False
+        message = self._program[self._index]
+        self._index += 1
+        if message is not None:
+            self._display._write(message)
+        return self._index < len(self._program)
+
+    def update(self) -> bool:
+        """
+        Send the next step once ``interval`` seconds have passed since the previous one.
+        Call this from the main loop.
+
+        :return: True if the effect has more steps left
+        :rtype: bool
+        """
+        if self.running and self._ticker.due(self._interval_ns):
+            return self.step()
+        return self.running
+
+    def stop(self) -> None:
+        """
+        Stop the running effect and turn the display back on.
+        """
+        self._start([])
+        self._display._write(self._on)
+
+
+def _check_level(value: int) -> None:
+    if not 0 <= value <= 15:
+        raise ValueError("Brightness out of range")
@@ -0,0 +1,186 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_max7219.grayscale`
+====================================================
+A few levels of gray on MAX7219 displays using bit plane modulation.
+
+The MAX7219 only knows on and off for each LED. `GrayscaleCanvas` splits each
+pixel level into bit planes, and shows plane ``n`` for ``2**n`` time units,
+so a pixel at level 3 of 0->3 is lit three times as long as a pixel at level 1.
+`GrayscaleCanvas.refresh` has to be called continuously to keep the image on screen.
+
+Each plane is sent while the display is shut down and then lit for exactly its
+time, so the weighting holds however long sending takes on a long chain, and
+nothing stays lit between calls to `GrayscaleCanvas.refresh`. The display is dark
+while sending, `GrayscaleCanvas.send_time` tells how long that is.
+"""
+
+import time
+
+from micropython import const
+
+try:
+    # Used only for typing
+    from adafruit_max7219.max7219 import MAX7219
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MAX7219.git"
+
+_SHUTDOWN = const(12)
+
+
+class GrayscaleCanvas:
+    """
+    Grayscale drawing surface for a MAX7219 display or chain of displays.
+
+    Drawing only changes the canvas, call `update` to rebuild the bit planes
+    and `refresh` as often as possible to show them. The display is left shut
+    down between refreshes, call `stop` before using it without the canvas again.
+    The display buffer is used as scratch space while `update` runs.
+
+    :param ~adafruit_max7219.max7219.MAX7219 display: the display to draw on
+    :param int bits: bits per pixel 1->4, giving ``2**bits`` levels (default 2)
+    :param float plane_time: seconds the least significant plane is shown for (default 0.0005)
+    """
+
+    def __init__(self, display: MAX7219, *, bits: int = 2, plane_time: float = 0.0005):
+        if not 1 <= bits <= 4:
+            raise ValueError("Bits per pixel out of range")
+        self._display = display
+        self.width = display.width
+        self.height = display.height
+        self.bits = bits
+        self.levels = 1 << bits
+        self._pixels = bytearray(self.width * self.height)
+
+        frame_size = len(display._frame)
+        row_size = frame_size // 8
+        self._on = bytearray([_SHUTDOWN, 1] * display.chain_length)
+        self._off = bytearray([_SHUTDOWN, 0] * display.chain_length)
+        self._planes = []
+        # the digit rows of each plane, followed by turning the display on
+        self._plane_bursts = []
+        for _ in range(bits):
+            plane = bytearray(frame_size)
+            view = memoryview(plane)
+            self._planes.append(plane)
+            self._plane_bursts.append(
+                [view[i : i + row_size] for i in range(0, frame_size, row_size)] + [self._on]
+            )
+        self.plane_time = plane_time
+        self._cycle_ns = 0
+        self._send_ns = 0
+        self._blanked = False
+        self.update()
+
+    @property
+    def plane_time(self) -> float:
+        """Seconds the least significant plane is shown for, the other planes are weighted."""
+        return self._plane_ns[0] / 1000000000
+
+    @plane_time.setter
+    def plane_time(self, value: float) -> None:
+        base = int(value * 1000000000)
+        self._plane_ns = [base << bit for bit in range(self.bits)]
+
+    @property
+    def refresh_rate(self) -> float:
+        """Full grayscale frames per second achieved by the last `refresh`."""
+        if not self._cycle_ns:
+            return 0.0
+        return 1000000000 / self._cycle_ns
+
+    @property
+    def send_time(self) -> float:
+        """
+        Seconds the slowest plane took to send in the last `refresh`, the display
+        is dark for this long once per plane.
+        """
+        return self._send_ns / 1000000000
+
+    def pixel(self, xpos: int, ypos: int, level: int = None) -> int:
+        """
+        Get or set the gray level of one pixel.
+
+        :param int xpos: x position of the pixel
+        :param int ypos: y position of the pixel
+        :param int level: 0->``levels - 1``, or None to read the pixel
+        :return: the level of the pixel when reading
+        :rtype: int
+        """
+        if xpos < 0 or ypos < 0 or xpos >= self.width or ypos >= self.height:
+            return None
+        if level is None:
+            return self._pixels[ypos * self.width + xpos]
+        if not 0 <= level < self.levels:
+            raise ValueError("Gray level out of range")
+        self._pixels[ypos * self.width + xpos] = level
+        return None
+
+    def fill(self, level: int) -> None:
+        """
+        Fill the whole canvas with one gray level.
+
+        :param int level: 0->``levels - 1``
+        """
+        if not 0 <= level < self.levels:
+            raise ValueError("Gray level out of range")
+        pixels = self._pixels
+        for i in range(len(pixels)):
+            pixels[i] = level
+
+    def update(self) -> None:
+        """
+        Split the canvas into bit planes, ready to be sent by `refresh`.
+        """
+        display = self._display
+        width = self.width
+        pixels = self._pixels
+        for bit in range(self.bits):
+            mask = 1 << bit
+            display.fill(0)
+            for i, level in enumerate(pixels):
+                if level & mask:
+                    display.pixel(i % width, i // width, 1)
+            display._pack_rows()
+            self._planes[bit][:] = display._frame
+
+    def refresh(self) -> None:
+        """
+        Show every bit plane once, each for its weighted time.
+        """
+        display = self._display
+        if not display._configured:
+            display._configure()
+        write = display._write
+        write_burst = display._write_burst
+        if not self._blanked:
+            write(self._off)
+            self._blanked = True
+        start = time.monotonic_ns()
+        longest = 0
+        for bit in range(self.bits):
+            sending = time.monotonic_ns()
+            # the rows go out while the display is dark, the last message lights it
+            write_burst(self._plane_bursts[bit])
+            lit = time.monotonic_ns()
+            longest = max(longest, lit - sending)
+            deadline = lit + self._plane_ns[bit]
+            while time.monotonic_ns() < deadline:
+                pass
+            write(self._off)
+        self._send_ns = longest
+        self._cycle_ns = time.monotonic_ns() - start
+
+    def stop(self) -> None:
+        """
+        Turn the display back on, showing the most significant plane until it is
+        next drawn on or refreshed.
+        """
+        self._display._write(self._on)
+        self._blanked = False
@@ -0,0 +1,176 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_max7219.integrity`
+====================================================
+Background resending of the display state, so chips whose registers were
+corrupted by electrical noise recover on their own.
+
+Instead of an occasional ``init_display`` and ``show``, which flash the display and
+send everything at once, `IntegrityRefresh` resends a little of what the chips
+should hold on every tick: the control registers last written (shutdown, scan
+limit, decode mode, intensity and display test) and the digit rows last sent,
+taking turns. Every register is rewritten within `IntegrityRefresh.period` ticks.
+
+Digit rows are resent from the frame `MAX7219.show` and `MAX7219.flush` send, so
+this doesn't work together with ``grayscale.GrayscaleCanvas``, which sends its
+own frames. With ``wire_layout`` that frame is also the drawing buffer, digit rows
+drawn on since they were last sent are skipped until they are shown.
+"""
+
+from micropython import const
+
+from adafruit_max7219._timing import Ticker
+
+try:
+    # Used only for typing
+    from typing import Optional
+
+    from adafruit_max7219.max7219 import MAX7219
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MAX7219.git"
+
+_DECODEMODE = const(9)
+_INTENSITY = const(10)
+_SCANLIMIT = const(11)
+_SHUTDOWN = const(12)
+_DISPLAYTEST = const(15)
+
+# the registers that blank or garble the most when corrupted go first
+_CONTROL_REGISTERS = (_SHUTDOWN, _SCANLIMIT, _DECODEMODE, _INTENSITY, _DISPLAYTEST)
+
+
+class IntegrityRefresh:
+    """
+    Round robin resender of control registers and digit rows.
+
+    Call `tick` to send the next share, or `update` from the main loop to send one
+    share every ``interval`` seconds. Nothing is sent until the display has been
+    set up by ``init_display`` or its first ``show``.
+
+    :param ~adafruit_max7219.max7219.MAX7219 display: the display to keep refreshed
+    :param int bytes_per_tick: bus bytes to spend per tick, rounded down to whole
+      messages of two bytes per chip, at least one and at most the 16 of a whole
+      `period` (default one control register and one digit row)
+    :param float interval: seconds between ticks when driven by `update` (default 0.1)
+    """
+
+    def __init__(
+        self,
+        display: MAX7219,
+        *,
+        bytes_per_tick: int = None,
+        interval: float = 0.1,
+    ):
+        self._display = display
+        self._message_size = 2 * display.chain_length
+        self.interval = interval
+        self.bytes_per_tick = 2 * self._message_size if bytes_per_tick is None else bytes_per_tick
+        self._register = 0
+        self._row = 0
+        self._register_turn = True
+        self._burst = []
+        self._ticker = Ticker()
+        self.reset_stats()
+
+    @property
+    def interval(self) -> float:
+        """Seconds between ticks when driven by `update`."""
+        return self._interval_ns / 1000000000
+
+    @interval.setter
+    def interval(self, value: float) -> None:
+        self._interval_ns = int(value * 1000000000)
+
+    @property
+    def bytes_per_tick(self) -> int:
+        """Bus bytes sent per tick, a whole number of messages."""
+        return self._per_tick * self._message_size
+
+    @bytes_per_tick.setter
+    def bytes_per_tick(self, value: int) -> None:
+        # more than a period would send the same registers twice in one tick
+        self._per_tick = min(max(1, value // self._message_size), 16)
+
+    @property
+    def period(self) -> int:
+        """The number of ticks it takes to resend every digit row and register."""
+        # registers and rows take turns, and there are fewer registers than rows
+        return (16 + self._per_tick - 1) // self._per_tick
+
+    def reset_stats(self) -> None:
+        """
+        Zero the ``ticks``, ``messages`` and ``bytes_sent`` counters.
+        """
+        self.ticks = 0
+        self.messages = 0
+        self.bytes_sent = 0
+
+    def _next_register(self) -> Optional[bytearray]:
+        """The next control register that has been written, or None"""
+        registers = self._display._registers
+        for _ in range(len(_CONTROL_REGISTERS)):
+            saved = registers.get(_CONTROL_REGISTERS[self._register])
+            self._register = (self._register + 1) % len(_CONTROL_REGISTERS)
+            if saved is not None:
+                return saved
+        return None
+
+    def _next_row(self) -> Optional[memoryview]:
+        """The next digit row as it was last sent, or None"""
+        display = self._display
+        # with the wire layout a changed row holds what is drawn, not what was sent
+        dirty = display._dirty if display._buffer is display._frame else 0
+        for _ in range(8):
+            row = self._row
+            self._row = (row + 1) % 8
+            if not dirty >> row & 1:
+                return display._rows[row]
+        return None
+
+    def tick(self) -> int:
+        """
+        Resend the next share of registers and digit rows.
+
+        :return: the number of bytes sent
+        :rtype: int
+        """
+        display = self._display
+        if not display._configured:
+            return 0
+        burst = self._burst
+        burst.clear()
+        for _ in range(self._per_tick):
+            message = None
+            if self._register_turn:
+                message = self._next_register()
+            self._register_turn = not self._register_turn
+            if message is None:
+                message = self._next_row()
+            if message is not None:
+                burst.append(message)
+        if not burst:
+            return 0
+        display._write_burst(burst)
+        sent = len(burst) * self._message_size
+        self.ticks += 1
+        self.messages += len(burst)
+        self.bytes_sent += sent
+        return sent
+
+    def update(self) -> bool:
+        """
+        Tick once ``interval`` seconds have passed since the previous tick.
+        Call this from the main loop.
+
+        :return: True if a tick was sent
+        :rtype: bool
+        """
+        if not self._ticker.due(self._interval_ns):
+            return False
+        return self.tick() > 0
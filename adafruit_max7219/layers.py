@@ -0,0 +1,368 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_max7219.layers`
+====================================================
+Layered drawing for MAX7219 displays.
+
+Backgrounds, sprites and text each live in their own `Layer` with a position and
+stacking order. A `Compositor` keeps track of what changed, and only recomposes
+those rectangles of the display buffer and sends the digit rows they touch, so
+moving a small sprite costs about the same on a small or a large display.
+"""
+
+try:
+    # Used only for typing
+    from typing import List
+
+    from adafruit_max7219.max7219 import MAX7219
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MAX7219.git"
+
+
+class Layer:
+    """
+    A 1 bit image placed on the display by a `Compositor`. Lit pixels are drawn over
+    the layers below, unlit pixels let them show through unless the layer is opaque.
+
+    :param int width: the number of pixels wide
+    :param int height: the number of pixels high
+    :param int x: x position of the left edge on the display (default 0)
+    :param int y: y position of the top edge on the display (default 0)
+    :param int z: stacking order, higher layers are drawn on top (default 0)
+    :param bool opaque: unlit pixels hide the layers below (default False)
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        *,
+        x: int = 0,
+        y: int = 0,
+        z: int = 0,
+        opaque: bool = False,
+    ):
+        self._x = x
+        self._y = y
+        self._z = z
+        self._visible = True
+        self.opaque = opaque
+        self._compositor = None
+        # changed area in layer coordinates, [x0, y0, x1, y1) or None
+        self._changed = None
+        self._allocate(width, height)
+
+    def _allocate(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        # rows are packed left to right starting at the low bit of the first byte
+        self._stride = (width + 7) // 8
+        self._buffer = bytearray(self._stride * height)
+
+    @property
+    def x(self) -> int:
+        """The x position of the left edge on the display."""
+        return self._x
+
+    @x.setter
+    def x(self, value: int) -> None:
+        self.move(value, self._y)
+
+    @property
+    def y(self) -> int:
+        """The y position of the top edge on the display."""
+        return self._y
+
+    @y.setter
+    def y(self, value: int) -> None:
+        self.move(self._x, value)
+
+    @property
+    def z(self) -> int:
+        """The stacking order, higher layers are drawn on top."""
+        return self._z
+
+    @z.setter
+    def z(self, value: int) -> None:
+        if value != self._z:
+            self._z = value
+            self._damage_bounds()
+            if self._compositor is not None:
+                self._compositor._sorted = False
+
+    @property
+    def visible(self) -> bool:
+        """False hides the layer without removing it."""
+        return self._visible
+
+    @visible.setter
+    def visible(self, value: bool) -> None:
+        if value != self._visible:
+            self._visible = value
+            self._damage_bounds()
+
+    def move(self, x: int, y: int) -> None:
+        """
+        Move the layer on the display.
+
+        :param int x: x position of the left edge
+        :param int y: y position of the top edge
+        """
+        if x == self._x and y == self._y:
+            return
+        self._damage_bounds()
+        self._x = x
+        self._y = y
+        self._damage_bounds()
+
+    def _damage_bounds(self) -> None:
+        """Record the area the layer covers right now as needing recomposition"""
+        if self._compositor is not None:
+            self._compositor._damage(self._x, self._y, self._x + self.width, self._y + self.height)
+
+    def _mark(self, x0: int, y0: int, x1: int, y1: int) -> None:
+        """Record a changed area in layer coordinates"""
+        changed = self._changed
+        if changed is None:
+            self._changed = [x0, y0, x1, y1]
+        else:
+            changed[0] = min(changed[0], x0)
+            changed[1] = min(changed[1], y0)
+            changed[2] = max(changed[2], x1)
+            changed[3] = max(changed[3], y1)
+
+    def pixel(self, xpos: int, ypos: int, bit_value: int = None) -> int:
+        """
+        Get or set one pixel of the layer.
+
+        :param int xpos: x position in the layer
+        :param int ypos: y position in the layer
+        :param int bit_value: value > 0 lights the pixel, else clears it, None reads it
+        :return: the pixel value when reading
+        :rtype: int
+        """
+        if xpos < 0 or ypos < 0 or xpos >= self.width or ypos >= self.height:
+            return None
+        index = ypos * self._stride + (xpos >> 3)
+        mask = 1 << (xpos & 7)
+        if bit_value is None:
+            return 1 if self._buffer[index] & mask else 0
+        if bit_value:
+            self._buffer[index] |= mask
+        else:
+            self._buffer[index] &= ~mask
+        self._mark(xpos, ypos, xpos + 1, ypos + 1)
+        return None
+
+    def fill(self, bit_value: int) -> None:
+        """
+        Fill the whole layer.
+
+        :param int bit_value: value > 0 lights every pixel, else clears them
+        """
+        value = 0xFF if bit_value else 0x00
+        buf = self._buffer
+        for i in range(len(buf)):
+            buf[i] = value
+        self._mark(0, 0, self.width, self.height)
+
+    def fill_rect(self, x: int, y: int, width: int, height: int, color: int) -> None:
+        """
+        Draw a filled rectangle in the layer.
+
+        :param int x: x position
+        :param int y: y position
+        :param int width: width of rectangle
+        :param int height: height of rectangle
+        :param int color: color of rectangle
+        """
+        for ypos in range(max(y, 0), min(y + height, self.height)):
+            for xpos in range(max(x, 0), min(x + width, self.width)):
+                self.pixel(xpos, ypos, color)
+
+    def _row_bits(self, ypos: int) -> int:
+        """One row of the layer as an int, bit 0 is the leftmost pixel"""
+        start = ypos * self._stride
+        bits = int.from_bytes(self._buffer[start : start + self._stride], "little")
+        # fill() also sets the padding bits past the right edge
+        return bits & ((1 << self.width) - 1)
+
+
+class TextLayer(Layer):
+    """
+    A layer showing one line of text, sized to fit it.
+
+    :param str text: the text to show
+    :param int x: x position of the left edge on the display (default 0)
+    :param int y: y position of the top edge on the display (default 0)
+    :param int z: stacking order, higher layers are drawn on top (default 0)
+    :param bool opaque: unlit pixels hide the layers below (default False)
+    :param str font_name: path to binary font file (default: "font5x8.bin")
+    """
+
+    def __init__(
+        self,
+        text: str,
+        *,
+        x: int = 0,
+        y: int = 0,
+        z: int = 0,
+        opaque: bool = False,
+        font_name: str = "font5x8.bin",
+    ):
+        from adafruit_framebuf import BitmapFont  # noqa: PLC0415
+
+        self._font = BitmapFont(font_name)
+        self._text = ""
+        super().__init__(0, self._font.font_height, x=x, y=y, z=z, opaque=opaque)
+        self.text = text
+
+    @property
+    def text(self) -> str:
+        """The text shown by the layer."""
+        return self._text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        if value == self._text:
+            return
+        width = len(value) * (self._font.font_width + 1)
+        if width != self.width:
+            self._damage_bounds()
+            self._allocate(width, self.height)
+        else:
+            self.fill(0)
+        self._text = value
+        for i, char in enumerate(value):
+            self._font.draw_char(char, i * (self._font.font_width + 1), 0, self, 1)
+        self._damage_bounds()
+
+
+class Compositor:
+    """
+    Composes layers into the buffer of a MAX7219 display, only redrawing what changed.
+
+    :param ~adafruit_max7219.max7219.MAX7219 display: the display to draw on
+    """
+
+    def __init__(self, display: MAX7219):
+        self._display = display
+        self._layers = []
+        self._sorted = True
+        # display areas to recompose, [x0, y0, x1, y1)
+        self._damaged = []
+
+    @property
+    def layers(self) -> List[Layer]:
+        """The layers, bottom first."""
+        self._sort()
+        return self._layers
+
+    def add(self, layer: Layer) -> None:
+        """
+        Put a layer on the display.
+
+        :param Layer layer: the layer to add
+        """
+        if layer._compositor is not None:
+            raise ValueError("Layer already belongs to a compositor")
+        layer._compositor = self
+        layer._changed = None
+        self._layers.append(layer)
+        self._sorted = False
+        layer._damage_bounds()
+
+    def remove(self, layer: Layer) -> None:
+        """
+        Take a layer off the display.
+
+        :param Layer layer: the layer to remove
+        """
+        layer._damage_bounds()
+        self._layers.remove(layer)
+        layer._compositor = None
+
+    def _sort(self) -> None:
+        if not self._sorted:
+            self._layers.sort(key=lambda layer: layer.z)
+            self._sorted = True
+
+    def _damage(self, x0: int, y0: int, x1: int, y1: int) -> None:
+        x0 = max(x0, 0)
+        y0 = max(y0, 0)
+        x1 = min(x1, self._display.width)
+        y1 = min(y1, self._display.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        # merge with an overlapping area instead of composing it twice
+        for rect in self._damaged:
+            if x0 < rect[2] and rect[0] < x1 and y0 < rect[3] and rect[1] < y1:
+                rect[0] = min(rect[0], x0)
+                rect[1] = min(rect[1], y0)
+                rect[2] = max(rect[2], x1)
+                rect[3] = max(rect[3], y1)
+                return
+        self._damaged.append([x0, y0, x1, y1])
+
+    def invalidate(self) -> None:
+        """
+        Recompose the whole display on the next `render`.
+        """
+        self._damage(0, 0, self._display.width, self._display.height)
+
+    def render(self, *, show: bool = True) -> None:
+        """
+        Recompose the changed areas into the display buffer.
+
+        :param bool show: also send the changed digit rows to the display (default True)
+        """
+        for layer in self._layers:
+            changed = layer._changed
+            if changed is not None:
+                layer._changed = None
+                if layer.visible:
+                    self._damage(
+                        layer.x + changed[0],
+                        layer.y + changed[1],
+                        layer.x + changed[2],
+                        layer.y + changed[3],
+                    )
+        self._sort()
+        damaged = self._damaged
+        self._damaged = []
+        for x0, y0, x1, y1 in damaged:
+            self._compose(x0, y0, x1, y1)
+        if show:
+            self._display.flush()
+
+    def _compose(self, x0: int, y0: int, x1: int, y1: int) -> None:
+        span = x1 - x0
+        span_mask = (1 << span) - 1
+        pixel_row = self._display.pixel_row
+        for ypos in range(y0, y1):
+            bits = 0
+            for layer in self._layers:
+                row = ypos - layer.y
+                if not layer.visible or row < 0 or row >= layer.height:
+                    continue
+                shift = layer.x - x0
+                if shift >= span or shift + layer.width <= 0:
+                    continue
+                layer_bits = layer._row_bits(row)
+                cover = (1 << layer.width) - 1
+                if shift >= 0:
+                    layer_bits <<= shift
+                    cover <<= shift
+                else:
+                    layer_bits >>= -shift
+                    cover >>= -shift
+                if layer.opaque:
+                    bits &= ~cover
+                bits |= layer_bits
+            pixel_row(ypos, bits & span_mask, xpos=x0, width=span)
@@ -8,14 +8,11 @@
 ====================================================
 """
 
-from adafruit_framebuf import BitmapFont
-from micropython import const
-
 from adafruit_max7219 import max7219
 
 try:
     # Used only for typing
-    from typing import Tuple
+    from typing import Optional, Sequence, Tuple
 
     import busio
     import digitalio
@@ -25,11 +22,6 @@ except ImportError:
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MAX7219.git"
 
-_DECODEMODE = const(9)
-_SCANLIMIT = const(11)
-_SHUTDOWN = const(12)
-_DISPLAYTEST = const(15)
-
 
 class Matrix8x8(max7219.MAX7219):
     """
@@ -37,21 +29,21 @@ class Matrix8x8(max7219.MAX7219):
 
     :param ~busio.SPI spi: an spi busio or spi bitbangio object
     :param ~digitalio.DigitalInOut cs: digital in/out to use as chip select signal
+    :param transport: sends the bytes to the chip, replaces ``spi`` and ``cs``
+      (default `adafruit_max7219.transports.SPIDeviceTransport`)
     """
 
-    def __init__(self, spi: busio.SPI, cs: digitalio.DigitalInOut):
-        super().__init__(8, 8, spi, cs)
+    def __init__(
+        self,
+        spi: busio.SPI,
+        cs: digitalio.DigitalInOut,
+        *,
+        transport: Optional[object] = None,
+    ):
+        super().__init__(8, 8, spi, cs, transport=transport)
 
     def init_display(self) -> None:
-        for cmd, data in (
-            (_SHUTDOWN, 0),
-            (_DISPLAYTEST, 0),
-            (_SCANLIMIT, 7),
-            (_DECODEMODE, 0),
-            (_SHUTDOWN, 1),
-        ):
-            self.write_cmd(cmd, data)
-
+        self._configure()
         self.fill(0)
         self.show()
 
@@ -86,7 +78,18 @@ class CustomMatrix(max7219.ChainableMAX7219):
     :param ~digitalio.DigitalInOut cs: digital in/out to use as chip select signal
     :param int width: the number of pixels wide
     :param int height: the number of pixels high
-    :param int rotation: the number of times to rotate the coordinate system (default 1)
+    :param int rotation: the number of times to rotate the coordinate system (default 1),
+      can be changed later through `rotation` or ``framebuf.rotation``
+    :param bool wire_layout: keep the buffer in transmit order so `show` sends it
+      without copying (default False). ``framebuf`` is not available in this layout.
+    :param topology: how the 8x8 modules are wired, one ``(column, row, orientation)``
+      tuple per module in chain order, starting at the module the microcontroller is
+      connected to. ``column`` and ``row`` give the module's place in the grid of
+      modules, ``orientation`` the number of clockwise quarter turns it is mounted
+      with, 2 for upside down. By default modules are wired row by row, left to right,
+      all in the same orientation, and ``rotation`` is applied.
+    :param transport: sends the bytes to the chips, replaces ``spi`` and ``cs``
+      (default `adafruit_max7219.transports.SPIDeviceTransport`)
     """
 
     def __init__(
@@ -97,16 +100,67 @@ class CustomMatrix(max7219.ChainableMAX7219):
         height: int,
         *,
         rotation: int = 1,
+        wire_layout: bool = False,
+        topology: Sequence[Tuple[int, int, int]] = None,
+        transport: Optional[object] = None,
     ):
-        super().__init__(width, height, spi, cs)
+        super().__init__(width, height, spi, cs, transport=transport, wire_layout=wire_layout)
 
         self.y_offset = width // 8
         self.y_index = self._calculate_y_coordinate_offsets()
 
-        self.framebuf.rotation = rotation
-        self.framebuf.fill_rect = self._fill_rect
         self._font = None
 
+        self._modules = None
+        if topology is not None:
+            self._modules = self._check_topology(topology)
+        self.rotation = rotation
+        self._get_pixel_table()
+
+    @property
+    def rotation(self) -> int:
+        """
+        The number of times the coordinate system is rotated, 0 to 3. Setting
+        ``framebuf.rotation`` changes it too. Not applied when a ``topology`` is given.
+        """
+        self._get_pixel_table()
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, value: int) -> None:
+        if value not in {0, 1, 2, 3}:
+            raise RuntimeError("Bad rotation setting")
+        self._rotation = value
+        if self._framebuf is not None:
+            self._framebuf.rotation = value
+        self._pixel_table = None
+
+    def _framebuf_created(self, framebuf: "adafruit_framebuf.FrameBuffer1") -> None:
+        super()._framebuf_created(framebuf)
+        framebuf.fill_rect = self.fill_rect
+
+    def _check_topology(self, topology: Sequence[Tuple[int, int, int]]) -> dict:
+        """
+        Validate a topology and index it by module grid position
+
+        :param topology: ``(column, row, orientation)`` of each module in chain order
+        :return: ``(chip, orientation)`` for each ``(column, row)``
+        :rtype: dict
+        """
+        if len(topology) != self.chain_length:
+            raise ValueError("Topology needs one entry per module")
+        modules = {}
+        for position, (column, row, orientation) in enumerate(topology):
+            if not (0 <= column < self.width // 8 and 0 <= row < self.height // 8):
+                raise ValueError("Module position out of range")
+            if (column, row) in modules:
+                raise ValueError("Two modules in the same position")
+            if orientation not in {0, 1, 2, 3}:
+                raise ValueError("Bad module orientation")
+            # the first chip clocked out ends up furthest from the microcontroller
+            modules[(column, row)] = (self.chain_length - 1 - position, orientation)
+        return modules
+
     def _calculate_y_coordinate_offsets(self) -> None:
         y_chunks = []
         for _ in range(self.chain_length // (self.width // 8)):
@@ -128,15 +182,7 @@ class CustomMatrix(max7219.ChainableMAX7219):
         return y_index
 
     def init_display(self) -> None:
-        for cmd, data in (
-            (_SHUTDOWN, 0),
-            (_DISPLAYTEST, 0),
-            (_SCANLIMIT, 7),
-            (_DECODEMODE, 0),
-            (_SHUTDOWN, 1),
-        ):
-            self.write_cmd(cmd, data)
-
+        self._configure()
         self.fill(0)
         self.show()
 
@@ -156,8 +202,14 @@ class CustomMatrix(max7219.ChainableMAX7219):
         """
         if xpos < 0 or ypos < 0 or xpos >= self.width or ypos >= self.height:
             return
-        buffer_x, buffer_y = self._pixel_coords_to_framebuf_coords(xpos, ypos)
-        return super().pixel(buffer_x, buffer_y, bit_value=bit_value)
+        address = self._get_pixel_table()[ypos * self.width + xpos]
+        if address == self._no_pixel:
+            return
+        if bit_value:
+            self._buffer[address >> 3] |= 1 << (address & 7)
+        else:
+            self._buffer[address >> 3] &= ~(1 << (address & 7))
+        self._dirty |= 1 << ((address >> 3) // self._row_bytes)
 
     def _pixel_coords_to_framebuf_coords(self, xpos: int, ypos: int) -> Tuple[int]:
         """
@@ -170,6 +222,36 @@ class CustomMatrix(max7219.ChainableMAX7219):
         """
         return (xpos - ((xpos // 8) * 8)) % 8, xpos // 8 + self.y_index[ypos * self.y_offset]
 
+    def _pixel_address(self, xpos: int, ypos: int) -> Optional[int]:
+        """
+        Locate a matrix pixel in the display buffer
+
+        :param int xpos: x position
+        :param int ypos: y position
+        :return: ``byte index << 3 | bit`` of the pixel, None if it is rotated out of the buffer
+        :rtype: int
+        """
+        if self._modules is not None:
+            chip, orientation = self._modules[(xpos // 8, ypos // 8)]
+            x, y = xpos % 8, ypos % 8
+            # undo the module's quarter turns to get its own column and row
+            if orientation == 1:
+                x, y = y, 7 - x
+            elif orientation == 2:
+                x, y = 7 - x, 7 - y
+            elif orientation == 3:
+                x, y = 7 - y, x
+            # column x of a module is bit x, its top row is the last digit register
+            index = (7 - y) * self.chain_length + chip
+            if self._wire_layout:
+                index = 2 * index + 1
+            return index << 3 | x
+
+        return super()._pixel_address(*self._pixel_coords_to_framebuf_coords(xpos, ypos))
+
+    def _pixel_grid(self) -> Tuple[int, int]:
+        return self.width, self.height
+
     def _get_pixel(self, xpos: int, ypos: int) -> int:
         """
         Get value of a matrix pixel
@@ -179,9 +261,10 @@ class CustomMatrix(max7219.ChainableMAX7219):
         :return: value of pixel in matrix
         :rtype: int
         """
-        x, y = self._pixel_coords_to_framebuf_coords(xpos, ypos)
-        buffer_value = self._buffer[-1 * y - 1]
-        return ((buffer_value & 2**x) >> x) & 1
+        address = self._get_pixel_table()[ypos * self.width + xpos]
+        if address == self._no_pixel:
+            return 0
+        return (self._buffer[address >> 3] >> (address & 7)) & 1
 
     # Adafruit Circuit Python Framebuf Scroll Function
     # Authors: Kattni Rembor, Melissa LeBlanc-Williams and Tony DiCola, for Adafruit Industries
@@ -238,7 +321,7 @@ class CustomMatrix(max7219.ChainableMAX7219):
                 else:
                     continue
 
-    def _fill_rect(self, x: int, y: int, width: int, height: int, color: int) -> None:
+    def fill_rect(self, x: int, y: int, width: int, height: int, color: int) -> None:
         """
         Draw a filled rectangle at the given position of the given size, color.
 
@@ -276,6 +359,8 @@ class CustomMatrix(max7219.ChainableMAX7219):
         for chunk in strg.split("\n"):
             if not self._font or self._font.font_name != font_name:
                 # load the font!
+                from adafruit_framebuf import BitmapFont  # noqa: PLC0415
+
                 self._font = BitmapFont(font_name)
             width = self._font.font_width
             height = self._font.font_height
@@ -287,5 +372,5 @@ class CustomMatrix(max7219.ChainableMAX7219):
                     and ypos + (height * size) > 0
                     and ypos < self.height
                 ):
-                    self._font.draw_char(char, char_x, ypos, self.framebuf, color, size=size)
+                    self._font.draw_char(char, char_x, ypos, self, color, size=size)
             ypos += height * size
@@ -41,16 +41,19 @@ Implementation Notes
 """
 
 # MicroPython MAX7219 driver, SPI interfaces
-import adafruit_framebuf as framebuf
-import digitalio
-from adafruit_bus_device import spi_device
+# adafruit_framebuf is only imported when the framebuf attribute is first used
+import array
+
 from micropython import const
 
+from adafruit_max7219.transports import SPIDeviceTransport
+
 try:
     # Used only for typing
-    import typing
+    from typing import List, Optional, Sequence, Tuple
 
     import busio
+    import digitalio
 except ImportError:
     pass
 
@@ -59,7 +62,11 @@ __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MAX7219.git"
 
 # register definitions
 _DIGIT0 = const(1)
+_DECODEMODE = const(9)
 _INTENSITY = const(10)
+_SCANLIMIT = const(11)
+_SHUTDOWN = const(12)
+_DISPLAYTEST = const(15)
 
 
 class MAX7219:
@@ -73,8 +80,15 @@ class MAX7219:
     :param int baudrate: for SPIDevice baudrate (default 8000000)
     :param int polarity: for SPIDevice polarity (default 0)
     :param int phase: for SPIDevice phase (default 0)
+    :param transport: sends the bytes to the chips, an object with ``write`` and
+      ``write_burst`` methods such as those in `adafruit_max7219.transports`.
+      ``spi`` and ``cs`` are not used when it is given (default `SPIDeviceTransport`)
     """
 
+    chain_length = 1
+    # DECODEMODE register value, one bit per digit that uses the code B font
+    _decode_mode = 0
+
     def __init__(
         self,
         width: int,
@@ -85,24 +99,117 @@ class MAX7219:
         baudrate: int = 8000000,
         polarity: int = 0,
         phase: int = 0,
+        transport: Optional[object] = None,
     ):
-        self._chip_select = cs
-        self._chip_select.direction = digitalio.Direction.OUTPUT
-
-        self._spi_device = spi_device.SPIDevice(
-            spi, cs, baudrate=baudrate, polarity=polarity, phase=phase
-        )
+        if transport is None:
+            transport = SPIDeviceTransport(
+                spi, cs, baudrate=baudrate, polarity=polarity, phase=phase
+            )
+        self._transport = transport
 
         self._buffer = bytearray((height // 8) * width)
-        self.framebuf = framebuf.FrameBuffer1(self._buffer, width, height)
+        self._framebuf = None
+        self._framebuf_size = (width, height)
+        # size of the unrotated ``framebuf`` coordinate system, and its rotation
+        self._pixel_size = (width, height)
+        self._rotation = 0
+        # one (register, data) pair per chip, reused by every command
+        self._cmd_buffer = bytearray(2 * self.chain_length)
+        # transmit frame, one message of (register, data) pairs per digit row
+        row_size = 2 * self.chain_length
+        self._frame = bytearray(8 * row_size)
+        frame = memoryview(self._frame)
+        self._rows = [frame[ypos * row_size : (ypos + 1) * row_size] for ypos in range(8)]
+        for index in range(0, len(self._frame), 2):
+            self._frame[index] = _DIGIT0 + index // row_size
 
         self.width = width
         self.height = height
 
-        self.init_display()
+        # the registers are set up by init_display(), or by the first show()
+        self._configured = False
+        # buffer address of every pixel, built when first needed
+        self._pixel_table = None
+        self._table_width = None
+        self._table_height = None
+        self._no_pixel = None
+        self._array_state = None
+        self._image_map = None
+        # one bit per digit row changed since the last show() or flush()
+        self._dirty = 0xFF
+        # buffer bytes per digit row, row of a buffer byte is index // _row_bytes
+        self._row_bytes = self.chain_length
+        # messages held back by batch(), with the registers each one writes
+        self._batch_depth = 0
+        self._batch_configured = False
+        self._batch_keys = []
+        self._batch_messages = []
+        # queue position after the last shutdown write, nothing is merged across it
+        self._batch_barrier = 0
+        # saved copies of the buffer, allocated by allocate_snapshots()
+        self._snapshots = []
+        # the last message sent to each control register, for resending
+        self._registers = {}
+
+    @property
+    def framebuf(self) -> "adafruit_framebuf.FrameBuffer1":
+        """
+        The ``adafruit_framebuf.FrameBuffer1`` drawing on the display buffer.
+        It is created, and adafruit_framebuf imported, the first time it is used.
+        """
+        # drawing through framebuf can't be tracked, assume every row changes
+        self._dirty = 0xFF
+        if self._framebuf is None:
+            if self._framebuf_size is None:
+                raise RuntimeError("framebuf is not available with this buffer layout")
+            import adafruit_framebuf  # noqa: PLC0415
+
+            self._framebuf = adafruit_framebuf.FrameBuffer1(self._buffer, *self._framebuf_size)
+            self._framebuf_created(self._framebuf)
+        return self._framebuf
+
+    @framebuf.setter
+    def framebuf(self, value: "adafruit_framebuf.FrameBuffer1") -> None:
+        self._framebuf = value
+        self._dirty = 0xFF
+
+    def _framebuf_created(self, framebuf: "adafruit_framebuf.FrameBuffer1") -> None:
+        """
+        Set up the ``framebuf`` built on first use, subclasses can add to it.
+
+        :param ~adafruit_framebuf.FrameBuffer1 framebuf: the new frame buffer
+        """
+        framebuf.rotation = self._rotation
 
     def init_display(self) -> None:
-        """Must be implemented by derived class (``matrices``, ``bcddigits``)"""
+        """
+        Set up the display registers and clear the display.
+        Must be implemented by derived class (``matrices``, ``bcddigits``).
+
+        Construction does not talk to the display, if this isn't called the
+        registers are set up by the first `show`, which keeps the buffer contents.
+        """
+
+    def _configure(self) -> None:
+        """
+        Send the register setup sequence in a single bus session.
+        """
+        self._configured = True
+        commands = (
+            (_SHUTDOWN, 0),
+            (_DISPLAYTEST, 0),
+            (_SCANLIMIT, 7),
+            (_DECODEMODE, self._decode_mode),
+            (_SHUTDOWN, 1),
+        )
+        size = len(self._cmd_buffer)
+        burst = bytearray(len(commands) * size)
+        for index, (cmd, data) in enumerate(commands):
+            for i in range(index * size, (index + 1) * size, 2):
+                burst[i] = cmd
+                burst[i + 1] = data
+        burst = memoryview(burst)
+        self._write_burst([burst[i : i + size] for i in range(0, len(burst), size)])
 
     def brightness(self, value: int) -> None:
         """
@@ -118,8 +225,51 @@ class MAX7219:
         """
         Updates the display.
         """
+        self._pack_rows()
+        self._send_frame()
+
+    def flush(self) -> None:
+        """
+        Updates only the digit rows of the display that changed since the last
+        `show` or `flush`. Anything drawn through ``framebuf`` changes every row.
+        """
+        dirty = self._dirty
+        if not self._configured:
+            dirty = 0xFF
+        if not dirty:
+            return
+        self._pack_rows(dirty)
+        self._send_frame(dirty)
+
+    def _send_frame(self, rows: int = 0xFF) -> None:
+        """
+        Send the transmit frame, setting up the display registers first if needed.
+
+        :param int rows: bit mask of the digit rows to send
+        """
+        if not self._configured:
+            self._configure()
+        self._dirty = 0
+        if rows == 0xFF:
+            self._write_burst(self._rows)
+        else:
+            self._write_burst([row for ypos, row in enumerate(self._rows) if rows >> ypos & 1])
+
+    def _pack_rows(self, rows: int = 0xFF) -> None:
+        """
+        Copy the display buffer into the data bytes of the transmit frame.
+
+        :param int rows: bit mask of the digit rows to copy
+        """
+        buf = self._buffer
+        frame = self._frame
+        size = len(buf)
+        chips = self.chain_length
         for ypos in range(8):
-            self.write_cmd(_DIGIT0 + ypos, self._buffer[ypos])
+            if rows >> ypos & 1:
+                for src in range(ypos * chips, (ypos + 1) * chips):
+                    # digit rows without backing buffer (fewer than 8 digits) are sent blank
+                    frame[2 * src + 1] = buf[src] if src < size else 0
 
     def fill(self, bit_value: int) -> None:
         """
@@ -140,6 +290,282 @@ class MAX7219:
         bit_value = 0x01 if bit_value else 0x00
         self.framebuf.pixel(xpos, ypos, bit_value)
 
+    def pixels(self, xs: Sequence[int], ys: Sequence[int], bit_value: int = 1) -> None:
+        """
+        Set many buffer bits in one call, at the same positions `pixel` sets them.
+
+        :param xs: x positions, a list, tuple or array of int
+        :param ys: y positions, the same length as ``xs``
+        :param int bit_value: value > 0 sets the buffer bits, else clears the buffer bits
+        """
+        table = self._get_pixel_table()
+        no_pixel = self._no_pixel
+        width = self._table_width
+        height = self._table_height
+        row_bytes = self._row_bytes
+        buf = self._buffer
+        dirty = 0
+        for xpos, ypos in zip(xs, ys):
+            if 0 <= xpos < width and 0 <= ypos < height:
+                address = table[ypos * width + xpos]
+                if address != no_pixel:
+                    index = address >> 3
+                    if bit_value:
+                        buf[index] |= 1 << (address & 7)
+                    else:
+                        buf[index] &= ~(1 << (address & 7))
+                    dirty |= 1 << (index // row_bytes)
+        self._dirty |= dirty
+
+    def pixel_row(self, ypos: int, mask: int, *, xpos: int = 0, width: int = None) -> None:
+        """
+        Set a run of buffer bits in one row from a bit mask, at the same positions
+        `pixel` sets them.
+
+        :param int ypos: y position of the row
+        :param int mask: bit 0 is the pixel at ``xpos``, bit 1 the one to its right, ...
+        :param int xpos: x position of the first pixel (default 0)
+        :param int width: number of pixels to set (default to the right edge)
+        """
+        table = self._get_pixel_table()
+        table_width = self._table_width
+        if not 0 <= ypos < self._table_height:
+            return
+        if width is None:
+            width = table_width - xpos
+        no_pixel = self._no_pixel
+        row_bytes = self._row_bytes
+        buf = self._buffer
+        start = max(xpos, 0)
+        end = min(xpos + width, table_width)
+        mask >>= start - xpos
+        base = ypos * table_width
+        dirty = 0
+        for x in range(start, end):
+            address = table[base + x]
+            if address != no_pixel:
+                index = address >> 3
+                if mask & 1:
+                    buf[index] |= 1 << (address & 7)
+                else:
+                    buf[index] &= ~(1 << (address & 7))
+                dirty |= 1 << (index // row_bytes)
+            mask >>= 1
+        self._dirty |= dirty
+
+    def _compile_pixel_table(self) -> array.array:
+        """
+        Build the pixel lookup table, ``byte index << 3 | bit`` for every pixel
+        in row major order, or the largest value of the table type when the pixel is
+        not in the buffer.
+
+        :return: the address of every pixel
+        :rtype: array.array
+        """
+        if len(self._buffer) < 0x1FFF:
+            typecode, self._no_pixel = "H", 0xFFFF
+        else:
+            typecode, self._no_pixel = "L", 0xFFFFFFFF
+        self._table_width, self._table_height = self._pixel_grid()
+        table = array.array(typecode)
+        for ypos in range(self._table_height):
+            for xpos in range(self._table_width):
+                address = self._pixel_address(xpos, ypos)
+                table.append(self._no_pixel if address is None else address)
+        return table
+
+    def _get_pixel_table(self) -> array.array:
+        """
+        The pixel lookup table, compiled on first use and again when the rotation
+        changes, also through ``framebuf``
+        """
+        framebuf = self._framebuf
+        if framebuf is not None and framebuf.rotation != self._rotation:
+            self._rotation = framebuf.rotation
+            self._pixel_table = None
+        if self._pixel_table is None:
+            self._pixel_table = self._compile_pixel_table()
+            # both are built from the table
+            self._image_map = None
+            self._array_state = None
+        return self._pixel_table
+
+    def _pixel_grid(self) -> Tuple[int, int]:
+        """
+        The width and height of the pixel coordinates, those of ``framebuf``
+        """
+        width, height = self._pixel_size
+        if self._rotation in {1, 3}:
+            return height, width
+        return width, height
+
+    def _pixel_address(self, xpos: int, ypos: int) -> Optional[int]:
+        """
+        Locate a pixel in the display buffer, rotated the same way ``framebuf`` does
+
+        :param int xpos: x position
+        :param int ypos: y position
+        :return: ``byte index << 3 | bit`` of the pixel, None if it is not in the buffer
+        :rtype: int
+        """
+        width, height = self._pixel_size
+        if self._rotation == 1:
+            xpos, ypos = width - ypos - 1, xpos
+        elif self._rotation == 2:
+            xpos, ypos = width - xpos - 1, height - ypos - 1
+        elif self._rotation == 3:
+            xpos, ypos = ypos, height - xpos - 1
+        if not (0 <= xpos < width and 0 <= ypos < height):
+            return None
+        return self._buffer_address(xpos, ypos)
+
+    def _buffer_address(self, xpos: int, ypos: int) -> int:
+        """
+        ``byte index << 3 | bit`` of an unrotated ``framebuf`` pixel
+
+        :param int xpos: x position
+        :param int ypos: y position
+        """
+        return ((ypos >> 3) * self._pixel_size[0] + xpos) << 3 | (ypos & 7)
+
+    def load_array(self, arr: "numpy.ndarray") -> None:
+        """
+        Copy a NumPy array into the display buffer, without a Python loop per pixel.
+        numpy is imported the first time this is called.
+
+        :param ~numpy.ndarray arr: ``height`` x ``width`` array, nonzero elements light the pixel
+        """
+        self._get_pixel_table()
+        if self._array_state is None:
+            self._array_state = self._compile_array_gather()
+        np, bits, gather, buffer, _ = self._array_state
+        height, width = self._table_height, self._table_width
+        if arr.shape != (height, width):
+            raise ValueError(f"Array must be same dimensions as display ({height}x{width}).")
+        np.not_equal(arr, 0, out=bits[:-2].reshape(arr.shape))
+        self._dirty = 0xFF
+        buffer[:] = np.packbits(bits[gather], axis=-1, bitorder="little").ravel()
+
+    def show_array(self, arr: "numpy.ndarray") -> None:
+        """
+        Copy a NumPy array into the display buffer and update the display.
+
+        :param ~numpy.ndarray arr: ``height`` x ``width`` array, nonzero elements light the pixel
+        """
+        self.load_array(arr)
+        _, _, _, buffer, frame_data = self._array_state
+        if frame_data is not None:
+            frame_data[: len(buffer)] = buffer
+        self._send_frame()
+
+    def image(self, img: "PIL.Image.Image") -> None:
+        """
+        Set buffer to value of Python Imaging Library image. The image is converted
+        to 1 bit mode if needed and must be the same size as the display.
+
+        :param ~PIL.Image.Image img: the image to copy into the buffer
+        """
+        self._get_pixel_table()
+        width, height = self._table_width, self._table_height
+        if img.size != (width, height):
+            raise ValueError(f"Image must be same dimensions as display ({width}x{height}).")
+        if img.mode != "1":
+            img = img.convert("1")
+        if self._image_map is None:
+            self._image_map = self._compile_image_map()
+        image_map = self._image_map
+        no_pixel = self._no_pixel
+        buf = self._buffer
+        # fill marks every row as changed
+        self.fill(0)
+        # tobytes() packs each image row into bytes, leftmost pixel in the top bit
+        for index, byte in enumerate(img.tobytes()):
+            if not byte:
+                continue
+            base = index << 3
+            for bit in range(8):
+                if byte & (0x80 >> bit):
+                    address = image_map[base + bit]
+                    if address != no_pixel:
+                        buf[address >> 3] |= 1 << (address & 7)
+
+    def _compile_image_map(self) -> array.array:
+        """
+        Buffer address of every bit of a packed 1 bit image, row padding included
+        """
+        table = self._get_pixel_table()
+        width = self._table_width
+        stride = (width + 7) // 8
+        image_map = array.array(table.typecode)
+        for ypos in range(self._table_height):
+            row = ypos * width
+            for xpos in range(stride * 8):
+                image_map.append(table[row + xpos] if xpos < width else self._no_pixel)
+        return image_map
+
+    def _compile_array_gather(self) -> Tuple:
+        """
+        Work out which array element, or constant, ends up in each bit of the buffer
+        """
+        import numpy as np  # noqa: PLC0415
+
+        table = np.array(self._get_pixel_table(), dtype=np.intp)
+        pixels = self._table_width * self._table_height
+        mapped = table != self._no_pixel
+        buffer = np.frombuffer(self._buffer, dtype=np.uint8)
+        # bits no pixel maps to keep their current value, the last two
+        # elements of bits are constant 0 and 1
+        current = np.unpackbits(buffer, bitorder="little").astype(bool)
+        gather = np.where(current, pixels + 1, pixels)
+        gather[table[mapped]] = np.arange(pixels)[mapped]
+        bits = np.zeros(pixels + 2, dtype=bool)
+        bits[-1] = True
+        frame_data = None
+        if self._buffer is not self._frame:
+            frame_data = np.frombuffer(self._frame, dtype=np.uint8)[1::2]
+        return np, bits, gather.reshape(-1, 8), buffer, frame_data
+
+    def allocate_snapshots(self, count: int) -> None:
+        """
+        Set aside memory for ``count`` copies of the display buffer, used by `snapshot`
+        and `restore`. Snapshots taken before are discarded.
+
+        :param int count: the number of snapshot slots
+        """
+        self._snapshots = [bytearray(len(self._buffer)) for _ in range(count)]
+
+    def snapshot(self, slot: int) -> None:
+        """
+        Save the display buffer, to put it back later with `restore`.
+
+        :param int slot: the slot to save in, 0 to one less than the count given to
+          `allocate_snapshots`
+        """
+        if not 0 <= slot < len(self._snapshots):
+            raise IndexError("Snapshot slot out of range")
+        self._snapshots[slot][:] = self._buffer
+
+    def restore(self, slot: int) -> None:
+        """
+        Put a saved display buffer back. Only the digit rows that differ from
+        the current buffer are marked as changed, `flush` sends just those.
+
+        :param int slot: the slot saved in with `snapshot`
+        """
+        if not 0 <= slot < len(self._snapshots):
+            raise IndexError("Snapshot slot out of range")
+        saved = self._snapshots[slot]
+        buf = self._buffer
+        row_bytes = self._row_bytes
+        dirty = 0
+        for ypos in range(8):
+            start = ypos * row_bytes
+            end = start + row_bytes
+            if buf[start:end] != saved[start:end]:
+                dirty |= 1 << ypos
+        buf[:] = saved
+        self._dirty |= dirty
+
     def scroll(self, delta_x: int, delta_y: int) -> None:
         """
         Srcolls the display using delta_x,delta_y.
@@ -157,9 +583,139 @@ class MAX7219:
         :param int data: data to be written to commanded register
         """
         # print('cmd {} data {}'.format(cmd,data))
-        self._chip_select.value = False
-        with self._spi_device as my_spi_device:
-            my_spi_device.write(bytearray([cmd, data]))
+        buf = self._cmd_buffer
+        for i in range(0, len(buf), 2):
+            buf[i] = cmd
+            buf[i + 1] = data
+        self._write(buf)
+
+    def batch(self) -> "_Batch":
+        """
+        Collect the commands and frames sent inside a ``with`` block and send them on
+        leaving it, in a single bus session. A write to registers already written in
+        the batch replaces the earlier write in its place in the queue, so showing
+        twice or setting the brightness twice costs nothing extra and writes keep
+        their order. Writes are never merged across a write to the shutdown register,
+        so the setup done by ``init_display`` stays blanked. Nothing is sent if the
+        block raises an exception. Batches can be nested, the outermost one sends.
+
+        .. code-block:: python
+
+            with display.batch():
+                display.brightness(3)
+                display.fill(0)
+                display.show()
+        """
+        return _Batch(self)
+
+    def _queue(self, buf: bytearray) -> None:
+        """
+        Hold back a message until the batch ends, replacing an earlier one that
+        writes the same registers since the last shutdown write.
+
+        :param bytearray buf: the (register, data) pairs
+        """
+        key = bytes(buf[0::2])
+        keys = self._batch_keys
+        messages = self._batch_messages
+        if buf[0] == _SHUTDOWN:
+            # shutdown brackets other writes, only merge it with one right before it
+            if keys and self._batch_barrier == len(keys) and keys[-1] == key:
+                messages[-1] = bytes(buf)
+                return
+            keys.append(key)
+            messages.append(bytes(buf))
+            self._batch_barrier = len(keys)
+            return
+        for index in range(self._batch_barrier, len(keys)):
+            if keys[index] == key:
+                messages[index] = bytes(buf)
+                return
+        keys.append(key)
+        messages.append(bytes(buf))
+
+    def _end_batch(self, send: bool) -> None:
+        """
+        Leave a batch, sending the held back messages when leaving the outermost one.
+
+        :param bool send: False drops the messages
+        """
+        self._batch_depth -= 1
+        if self._batch_depth:
+            return
+        messages = self._batch_messages
+        self._batch_keys = []
+        self._batch_messages = []
+        self._batch_barrier = 0
+        if not send:
+            if messages:
+                # the display didn't get what the driver thinks it has
+                self._configured = self._batch_configured
+                self._dirty = 0xFF
+            return
+        if messages:
+            for message in messages:
+                self._remember(message)
+            self._transport.write_burst(messages)
+
+    def _remember(self, buf: bytearray) -> None:
+        """
+        Keep a copy of a message to a control register.
+
+        :param bytearray buf: the (register, data) pairs sent
+        """
+        if buf[0] >= _DECODEMODE:
+            saved = self._registers.get(buf[0])
+            if saved is None:
+                saved = self._registers[buf[0]] = bytearray(len(buf))
+            saved[:] = buf
+
+    def _write(self, buf: bytearray) -> None:
+        """
+        Send one latched message, two bytes per chip in the chain.
+
+        :param bytearray buf: the (register, data) pairs to clock out
+        """
+        if self._batch_depth:
+            self._queue(buf)
+        else:
+            self._remember(buf)
+            self._transport.write(buf)
+
+    def _write_burst(self, bufs: List[bytearray]) -> None:
+        """
+        Send several latched messages while holding the bus once.
+
+        :param list bufs: the messages, two bytes per chip in the chain each
+        """
+        if self._batch_depth:
+            for buf in bufs:
+                self._queue(buf)
+        else:
+            for buf in bufs:
+                self._remember(buf)
+            self._transport.write_burst(bufs)
+
+
+class _Batch:
+    """
+    Context manager returned by `MAX7219.batch`
+
+    :param MAX7219 display: the display to batch the messages of
+    """
+
+    def __init__(self, display: MAX7219):
+        self._display = display
+
+    def __enter__(self) -> MAX7219:
+        display = self._display
+        if not display._batch_depth:
+            display._batch_configured = display._configured
+        display._batch_depth += 1
+        return display
+
+    def __exit__(self, exc_type: Optional[type], exc_value: object, traceback: object) -> None:
+        self._display._end_batch(exc_type is None)
 
 
 class ChainableMAX7219(MAX7219):
@@ -173,6 +729,11 @@ class ChainableMAX7219(MAX7219):
     :param int baudrate: for SPIDevice baudrate (default 8000000)
     :param int polarity: for SPIDevice polarity (default 0)
     :param int phase: for SPIDevice phase (default 0)
+    :param transport: sends the bytes to the chips, replaces ``spi`` and ``cs``
+      (default `SPIDeviceTransport`)
+    :param bool wire_layout: keep the buffer in transmit order (default False).
+      Each digit row is stored as the (register, data) pairs `show` sends, so showing
+      needs no copying, but the buffer can't be drawn on through ``framebuf``.
     """
 
     def __init__(
@@ -185,39 +746,76 @@ class ChainableMAX7219(MAX7219):
         baudrate: int = 8000000,
         polarity: int = 0,
         phase: int = 0,
+        transport: Optional[object] = None,
+        wire_layout: bool = False,
     ):
         self.chain_length = (height // 8) * (width // 8)
 
-        super().__init__(width, height, spi, cs, baudrate=baudrate, polarity=polarity, phase=phase)
-        self._buffer = bytearray(self.chain_length * 8)
-        self.framebuf = framebuf.FrameBuffer1(self._buffer, self.chain_length * 8, 8)
+        super().__init__(
+            width,
+            height,
+            spi,
+            cs,
+            baudrate=baudrate,
+            polarity=polarity,
+            phase=phase,
+            transport=transport,
+        )
+        self._wire_layout = wire_layout
+        self._pixel_size = (self.chain_length * 8, 8)
+        if wire_layout:
+            # the data byte of chip c in digit row r is at 2 * (r * chain_length + c) + 1
+            self._buffer = self._frame
+            self._framebuf_size = None
+            self._row_bytes = 2 * self.chain_length
+        else:
+            # the data byte of chip c in digit row r is at r * chain_length + c
+            self._buffer = bytearray(self.chain_length * 8)
+            self._framebuf_size = (self.chain_length * 8, 8)
+
+    def _pack_rows(self, rows: int = 0xFF) -> None:
+        if not self._wire_layout:
+            super()._pack_rows(rows)
 
-    def write_cmd(self, cmd: int, data: int) -> None:
+    def fill(self, bit_value: int) -> None:
         """
-        Writes a command to spi device.
+        Fill the display buffer.
 
-        :param int cmd: register address to write data to
-        :param int data: data to be written to commanded register
+        :param int bit_value: value > 0 set the buffer bit, else clears the buffer bit
         """
-        # print('cmd {} data {}'.format(cmd,data))
-        self._chip_select.value = False
-        with self._spi_device as my_spi_device:
-            for _ in range(self.chain_length):
-                my_spi_device.write(bytearray([cmd, data]))
+        if not self._wire_layout:
+            super().fill(bit_value)
+            return
+        value = 0xFF if bit_value else 0x00
+        buf = self._buffer
+        for index in range(1, len(buf), 2):
+            buf[index] = value
+        self._dirty = 0xFF
 
-    def show(self) -> None:
+    def pixel(self, xpos: int, ypos: int, bit_value: int = None) -> None:
         """
-        Updates the display.
+        Set one buffer bit
+
+        :param int xpos: x position to set bit
+        :param int ypos: y position to set bit
+        :param int bit_value: value > 0 sets the buffer bit, else clears the buffer bit
         """
-        for ypos in range(8):
-            self._chip_select.value = False
-            with self._spi_device as my_spi_device:
-                for chip in range(self.chain_length):
-                    my_spi_device.write(
-                        bytearray(
-                            [
-                                _DIGIT0 + ypos,
-                                self._buffer[ypos * self.chain_length + chip],
-                            ]
-                        )
-                    )
+        if not self._wire_layout:
+            super().pixel(xpos, ypos, bit_value)
+        elif 0 <= xpos < self.chain_length * 8 and 0 <= ypos < 8:
+            if bit_value:
+                self._buffer[2 * xpos + 1] |= 1 << ypos
+            else:
+                self._buffer[2 * xpos + 1] &= ~(1 << ypos)
+            self._dirty |= 1 << (xpos // self.chain_length)
+
+    def _buffer_address(self, xpos: int, ypos: int) -> int:
+        """
+        ``byte index << 3 | bit`` of an unrotated ``framebuf`` pixel
+
+        :param int xpos: x position
+        :param int ypos: y position
+        """
+        if self._wire_layout:
+            xpos = 2 * xpos + 1
+        return xpos << 3 | ypos
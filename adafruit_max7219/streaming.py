@@ -0,0 +1,237 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_max7219.streaming`
+====================================================
+Show frames rendered by another process, on Linux.
+
+`FrameServer` owns the display and receives ready to send frames over a UNIX
+datagram socket, UDP on localhost, or a stream such as stdin. A frame is exactly
+what `MAX7219.show` sends: for each digit row 1 to 8, one (register, data) byte
+pair per chip in transmit order, so ``16 * chain_length`` bytes in total.
+
+When frames arrive faster than they can be shown only the newest one is shown,
+the others are counted as dropped. ``show_time`` is how long showing a frame took
+once the server woke up to it, time a frame spent waiting in the socket or pipe
+before that isn't known to the server and is not included.
+
+Sending a frame from another process::
+
+    import socket
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    sock.sendto(frame, "/tmp/max7219.sock")
+"""
+
+import os
+import select
+import socket
+import time
+
+try:
+    # Used only for typing
+    from typing import BinaryIO, Optional, Union
+
+    from adafruit_max7219.max7219 import MAX7219
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MAX7219.git"
+
+
+class FrameServer:
+    """
+    Receives frames and shows them on a display, newest frame wins.
+
+    Use `unix`, `udp` or `stream` to create one. ``closed`` becomes True
+    when a stream source reaches its end.
+
+    :param ~adafruit_max7219.max7219.MAX7219 display: the display to show frames on
+    :param source: a bound datagram socket, or a readable binary stream
+    :param str path: UNIX socket path to remove on `deinit`, if any
+    """
+
+    def __init__(
+        self,
+        display: MAX7219,
+        source: Union[socket.socket, BinaryIO],
+        *,
+        path: Optional[str] = None,
+    ):
+        self._display = display
+        self._source = source
+        self._path = path
+        self._datagram = isinstance(source, socket.socket)
+        if self._datagram:
+            source.setblocking(False)
+        else:
+            # read the file descriptor directly, so select() sees all unread data
+            self._fd = source.fileno()
+            # the stream may be shared with a parent, such as stdin, put it back on deinit
+            self._blocking = os.get_blocking(self._fd)
+            os.set_blocking(self._fd, False)
+        self.closed = False
+
+        self.frame_size = len(display._frame)
+        # the register bytes a frame must carry, frames are shown from _latest
+        self._registers = bytes(display._frame[0::2])
+        # one byte more than a frame, so a datagram that is too long doesn't fit
+        self._latest = bytearray(self.frame_size + 1)
+        self._spare = bytearray(self.frame_size + 1)
+        self._filled = 0
+        self._fresh = 0
+        self.reset_stats()
+
+    @classmethod
+    def unix(cls, display: MAX7219, path: str) -> "FrameServer":
+        """
+        Receive frames as datagrams on a UNIX socket.
+
+        :param ~adafruit_max7219.max7219.MAX7219 display: the display to show frames on
+        :param str path: filesystem path of the socket, replaced if it exists
+        """
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.bind(path)
+        return cls(display, sock, path=path)
+
+    @classmethod
+    def udp(cls, display: MAX7219, port: int, host: str = "127.0.0.1") -> "FrameServer":
+        """
+        Receive frames as UDP datagrams, one frame per datagram.
+
+        :param ~adafruit_max7219.max7219.MAX7219 display: the display to show frames on
+        :param int port: UDP port to listen on
+        :param str host: address to listen on (default localhost only)
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.bind((host, port))
+        return cls(display, sock)
+
+    @classmethod
+    def stream(cls, display: MAX7219, stream: BinaryIO) -> "FrameServer":
+        """
+        Read back to back frames from a binary stream such as ``sys.stdin.buffer``.
+        When a stray or lost byte breaks a frame it counts as an error, and bytes
+        are skipped up to the next place the register bytes of a frame line up.
+
+        :param ~adafruit_max7219.max7219.MAX7219 display: the display to show frames on
+        :param stream: the stream to read from
+        """
+        return cls(display, stream)
+
+    def reset_stats(self) -> None:
+        """
+        Zero the frame counters and timings.
+        """
+        self.received = 0
+        self.shown = 0
+        self.dropped = 0
+        self.errors = 0
+        self.show_time = 0.0
+        self.max_show_time = 0.0
+
+    def _accept(self) -> bool:
+        """Make the frame just received in _spare the newest one, if it is valid"""
+        if self._spare[0 : self.frame_size : 2] != self._registers:
+            self.errors += 1
+            return False
+        self.received += 1
+        self._spare, self._latest = self._latest, self._spare
+        self._fresh += 1
+        return True
+
+    def _resync(self) -> None:
+        """Drop bytes from the front of _spare up to where the next frame could start"""
+        spare = self._spare
+        size = self.frame_size
+        for start in range(1, size):
+            # the register bytes received so far must all be in their places
+            if spare[start:size:2] == self._registers[: (size - start + 1) // 2]:
+                break
+        else:
+            start = size
+        spare[: size - start] = spare[start:size]
+        self._filled = size - start
+
+    def _receive(self) -> None:
+        """Take in everything that is waiting"""
+        if self._datagram:
+            while True:
+                try:
+                    size = self._source.recv_into(self._spare)
+                except BlockingIOError:
+                    return
+                if size == self.frame_size:
+                    self._accept()
+                else:
+                    self.errors += 1
+        while True:
+            try:
+                size = os.readv(
+                    self._fd, (memoryview(self._spare)[self._filled : self.frame_size],)
+                )
+            except BlockingIOError:
+                return
+            if not size:
+                # end of the stream
+                self.closed = True
+                return
+            self._filled += size
+            if self._filled == self.frame_size:
+                self._filled = 0
+                if not self._accept():
+                    # a stray or missing byte shifted the stream, find the frames again
+                    self._resync()
+
+    def poll(self, timeout: Optional[float] = 0) -> bool:
+        """
+        Wait for frames and show the newest one.
+
+        :param float timeout: seconds to wait for a frame, None waits forever (default 0)
+        :return: True if a frame was shown
+        :rtype: bool
+        """
+        readable, _, _ = select.select((self._source,), (), (), timeout)
+        if not readable:
+            return False
+        start = time.monotonic_ns()
+        self._fresh = 0
+        self._receive()
+        if not self._fresh:
+            return False
+        self.dropped += self._fresh - 1
+
+        display = self._display
+        display._frame[:] = memoryview(self._latest)[: self.frame_size]
+        display._send_frame()
+        self.shown += 1
+        self.show_time = (time.monotonic_ns() - start) / 1000000000
+        self.max_show_time = max(self.max_show_time, self.show_time)
+        return True
+
+    def serve_forever(self) -> None:
+        """
+        Show frames as they arrive, until interrupted or the stream ends.
+        """
+        while not self.closed:
+            self.poll(None)
+
+    def deinit(self) -> None:
+        """
+        Stop receiving, close the socket and remove its path. A stream is left
+        open, blocking again if it was before.
+        """
+        if self._datagram:
+            self._source.close()
+        else:
+            os.set_blocking(self._fd, self._blocking)
+        if self._path is not None:
+            os.unlink(self._path)
+            self._path = None
@@ -0,0 +1,336 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_max7219.transports`
+====================================================
+Ways of getting bytes to a chain of MAX7219 chips.
+
+A transport sends messages, each one two bytes per chip in the chain, and latches
+every message into the chips by raising chip select after it. Displays use
+`SPIDeviceTransport` unless another one is passed as ``transport``.
+
+* `SPIDeviceTransport` locks and configures the bus for every message, or once per burst
+* `LockedSPITransport` locks and configures the bus once and keeps it, for a bus
+  that only has MAX7219 chips on it
+* `SpidevTransport` sends each burst, such as all 8 rows of a frame, with one
+  ioctl on Linux ``/dev/spidev`` devices
+* `FakeTransport` records what would be sent, for tests and benchmarks
+"""
+
+from adafruit_bus_device import spi_device
+
+try:
+    # Used only for typing
+    from typing import List
+
+    import busio
+    import digitalio
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MAX7219.git"
+
+
+class SPIDeviceTransport:
+    """
+    Sends messages through an ``adafruit_bus_device.spi_device.SPIDevice``, sharing
+    the bus with other devices.
+
+    :param ~busio.SPI spi: an spi busio or spi bitbangio object
+    :param ~digitalio.DigitalInOut cs: digital in/out to use as chip select signal
+    :param int baudrate: for SPIDevice baudrate (default 8000000)
+    :param int polarity: for SPIDevice polarity (default 0)
+    :param int phase: for SPIDevice phase (default 0)
+    """
+
+    def __init__(
+        self,
+        spi: busio.SPI,
+        cs: digitalio.DigitalInOut,
+        *,
+        baudrate: int = 8000000,
+        polarity: int = 0,
+        phase: int = 0,
+    ):
+        self._chip_select = cs
+        self._chip_select.switch_to_output(value=True)
+        self._spi_device = spi_device.SPIDevice(
+            spi, cs, baudrate=baudrate, polarity=polarity, phase=phase
+        )
+
+    def write(self, buf: bytearray) -> None:
+        """
+        Send one latched message.
+
+        :param bytearray buf: the (register, data) pairs to clock out
+        """
+        # SPIDevice lowers chip select once it holds the bus lock
+        with self._spi_device as my_spi_device:
+            my_spi_device.write(buf)
+
+    def write_burst(self, bufs: List[bytearray]) -> None:
+        """
+        Send several latched messages while holding the bus once.
+
+        :param list bufs: the messages to clock out
+        """
+        with self._spi_device as my_spi_device:
+            for index, buf in enumerate(bufs):
+                if index:
+                    # a rising edge on chip select latches the previous message
+                    self._chip_select.value = True
+                    self._chip_select.value = False
+                my_spi_device.write(buf)
+
+    def deinit(self) -> None:
+        """
+        Nothing to release, the bus is only held while sending.
+        """
+
+
+class LockedSPITransport:
+    """
+    Locks and configures the SPI bus the first time it sends and keeps it locked,
+    so messages only cost the transfer and the chip select toggles. Other devices
+    can't use the bus until `unlock` or `deinit` is called.
+
+    :param ~busio.SPI spi: an spi busio or spi bitbangio object
+    :param ~digitalio.DigitalInOut cs: digital in/out to use as chip select signal
+    :param int baudrate: SPI baudrate (default 8000000)
+    :param int polarity: SPI polarity (default 0)
+    :param int phase: SPI phase (default 0)
+    """
+
+    def __init__(
+        self,
+        spi: busio.SPI,
+        cs: digitalio.DigitalInOut,
+        *,
+        baudrate: int = 8000000,
+        polarity: int = 0,
+        phase: int = 0,
+    ):
+        self._spi = spi
+        self._chip_select = cs
+        self._chip_select.switch_to_output(value=True)
+        self._baudrate = baudrate
+        self._polarity = polarity
+        self._phase = phase
+        self._locked = False
+
+    def _lock(self) -> None:
+        while not self._spi.try_lock():
+            pass
+        self._spi.configure(baudrate=self._baudrate, polarity=self._polarity, phase=self._phase)
+        self._locked = True
+
+    def write(self, buf: bytearray) -> None:
+        """
+        Send one latched message.
+
+        :param bytearray buf: the (register, data) pairs to clock out
+        """
+        if not self._locked:
+            self._lock()
+        self._chip_select.value = False
+        self._spi.write(buf)
+        self._chip_select.value = True
+
+    def write_burst(self, bufs: List[bytearray]) -> None:
+        """
+        Send several latched messages.
+
+        :param list bufs: the messages to clock out
+        """
+        if not self._locked:
+            self._lock()
+        chip_select = self._chip_select
+        write = self._spi.write
+        for buf in bufs:
+            chip_select.value = False
+            write(buf)
+            chip_select.value = True
+
+    def unlock(self) -> None:
+        """
+        Let other devices use the bus, it is locked again by the next message.
+        """
+        if self._locked:
+            self._spi.unlock()
+            self._locked = False
+
+    def deinit(self) -> None:
+        """
+        Release the bus.
+        """
+        self.unlock()
+
+
+class SpidevTransport:
+    """
+    Sends messages through a Linux ``/dev/spidev`` device, with a whole burst in a
+    single ``SPI_IOC_MESSAGE`` ioctl. The kernel driver handles chip select,
+    pulsing it between the messages of a burst.
+
+    :param int bus: SPI bus number, the ``X`` in ``/dev/spidevX.Y``
+    :param int device: chip select number, the ``Y`` in ``/dev/spidevX.Y``
+    :param int speed_hz: SPI clock frequency (default 8000000)
+    :param int mode: SPI mode, polarity << 1 | phase (default 0)
+    :param int max_burst: most bytes sent in one ioctl, the spidev ``bufsiz``
+      module parameter (default 4096)
+    """
+
+    def __init__(
+        self,
+        bus: int,
+        device: int,
+        *,
+        speed_hz: int = 8000000,
+        mode: int = 0,
+        max_burst: int = 4096,
+    ):
+        # Linux only, so not imported at module level
+        import ctypes  # noqa: PLC0415
+        import fcntl  # noqa: PLC0415
+        import os  # noqa: PLC0415
+        import struct  # noqa: PLC0415
+
+        self._ctypes = ctypes
+        self._ioctl = fcntl.ioctl
+        self._pack_into = struct.pack_into
+        self._close = os.close
+        self._fd = os.open(f"/dev/spidev{bus}.{device}", os.O_RDWR)
+        self._speed_hz = speed_hz
+        self._max_burst = max_burst
+        self._ioctl(self._fd, _spi_ioc(1, 1), struct.pack("B", mode))
+        self._ioctl(self._fd, _spi_ioc(3, 1), struct.pack("B", 8))
+        self._ioctl(self._fd, _spi_ioc(4, 4), struct.pack("I", speed_hz))
+
+    def _send(self, bufs: List[bytearray]) -> None:
+        """One ioctl for all of bufs"""
+        count = len(bufs)
+        transfers = bytearray(_TRANSFER_SIZE * count)
+        # keep the exported buffers alive until the ioctl returns
+        pinned = []
+        for index, buf in enumerate(bufs):
+            # ctypes can only point into writable buffers
+            data = bytearray(buf) if isinstance(buf, bytes) else buf
+            pin = (self._ctypes.c_char * len(data)).from_buffer(data)
+            pinned.append(pin)
+            self._pack_into(
+                _TRANSFER_FORMAT,
+                transfers,
+                index * _TRANSFER_SIZE,
+                self._ctypes.addressof(pin),
+                0,
+                len(data),
+                self._speed_hz,
+                0,
+                8,
+                # deselect between messages, so every one of them is latched
+                1 if index < count - 1 else 0,
+                0,
+                0,
+                0,
+                0,
+            )
+        self._ioctl(self._fd, _spi_ioc(0, len(transfers)), transfers)
+
+    def write(self, buf: bytearray) -> None:
+        """
+        Send one latched message.
+
+        :param bytearray buf: the (register, data) pairs to clock out
+        """
+        self._send([buf])
+
+    def write_burst(self, bufs: List[bytearray]) -> None:
+        """
+        Send several latched messages, in as few ioctls as ``max_burst`` and the
+        ioctl size field allow.
+
+        :param list bufs: the messages to clock out
+        """
+        start = 0
+        size = 0
+        for index, buf in enumerate(bufs):
+            if size and (size + len(buf) > self._max_burst or index - start == _MAX_TRANSFERS):
+                self._send(bufs[start:index])
+                start = index
+                size = 0
+            size += len(buf)
+        if start < len(bufs):
+            self._send(bufs[start:])
+
+    def deinit(self) -> None:
+        """
+        Close the spidev device.
+        """
+        if self._fd is not None:
+            self._close(self._fd)
+            self._fd = None
+
+
+# struct spi_ioc_transfer from linux/spi/spidev.h
+_TRANSFER_FORMAT = "QQIIHBBBBBB"
+_TRANSFER_SIZE = 32
+# the ioctl request code has a 14 bit size field
+_MAX_TRANSFERS = 0x3FFF // _TRANSFER_SIZE
+
+
+def _spi_ioc(number: int, size: int) -> int:
+    """_IOW('k', number, size), the spidev ioctl request codes"""
+    return 1 << 30 | size << 16 | ord("k") << 8 | number
+
+
+class FakeTransport:
+    """
+    Records messages instead of sending them, for tests and benchmarks.
+
+    :param bool record: keep a copy of every message in ``messages`` (default True)
+    """
+
+    def __init__(self, *, record: bool = True):
+        self.record = record
+        self.messages = []
+        self.transactions = 0
+        self.bytes_sent = 0
+
+    def write(self, buf: bytearray) -> None:
+        """
+        Record one latched message.
+
+        :param bytearray buf: the (register, data) pairs
+        """
+        self.transactions += 1
+        self.bytes_sent += len(buf)
+        if self.record:
+            self.messages.append(bytes(buf))
+
+    def write_burst(self, bufs: List[bytearray]) -> None:
+        """
+        Record several latched messages, counted as one transaction.
+
+        :param list bufs: the messages
+        """
+        self.transactions += 1
+        for buf in bufs:
+            self.bytes_sent += len(buf)
+            if self.record:
+                self.messages.append(bytes(buf))
+
+    def clear(self) -> None:
+        """
+        Forget the recorded messages and zero the counters.
+        """
+        self.messages = []
+        self.transactions = 0
+        self.bytes_sent = 0
+
+    def deinit(self) -> None:
+        """
+        Nothing to release.
+        """
@@ -0,0 +1,127 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_max7219.widgets`
+====================================================
+Text that is cheap to update on MAX7219 matrices.
+
+A `TextWidget` owns a fixed row of character cells on the display. Setting its
+text only redraws the cells whose character changed, so a clock that ticks once a
+second draws one glyph instead of the whole line.
+
+Only the digit rows the redrawn cells cover are marked as changed, but each digit
+row message carries that row of every chip in the chain. When a glyph covers all
+8 digit rows, as it does on a single row of modules, ``flush`` still sends the
+whole frame: the saving is in drawing, not in bus traffic.
+"""
+
+try:
+    # Used only for typing
+    from typing import List, Tuple
+
+    from adafruit_max7219.max7219 import MAX7219
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MAX7219.git"
+
+
+class _GlyphRecorder:
+    """Stands in for a display in ``BitmapFont.draw_char``, collecting row masks"""
+
+    def __init__(self, height: int):
+        self.rows = [0] * height
+
+    def fill_rect(self, x: int, y: int, width: int, height: int, color: int) -> None:
+        # draw_char fills one pixel at a time at size 1
+        self.rows[y] |= 1 << x
+
+
+class TextWidget:
+    """
+    A fixed number of character cells on a display, redrawn cell by cell.
+
+    Each cell is one glyph plus a blank column, like ``CustomMatrix.text`` lays them
+    out. Text longer than ``length`` is cut off, shorter text is padded with spaces.
+    The widget only changes the display buffer, call ``flush`` or ``show`` on the
+    display to send it.
+
+    :param ~adafruit_max7219.max7219.MAX7219 display: the display to draw on
+    :param int xpos: x position of the left edge of the first cell
+    :param int ypos: y position of the top of the cells
+    :param int length: number of character cells
+    :param str text: text to draw right away (default "")
+    :param str font_name: path to binary font file (default: "font5x8.bin")
+    """
+
+    def __init__(
+        self,
+        display: MAX7219,
+        xpos: int,
+        ypos: int,
+        length: int,
+        *,
+        text: str = "",
+        font_name: str = "font5x8.bin",
+    ):
+        from adafruit_framebuf import BitmapFont  # noqa: PLC0415
+
+        self._display = display
+        self._font = BitmapFont(font_name)
+        self.xpos = xpos
+        self.ypos = ypos
+        self.length = length
+        self.cell_width = self._font.font_width + 1
+        # row masks of every glyph drawn so far
+        self._glyphs = {}
+        # the character drawn in each cell, None when the cell needs drawing
+        self._cells = [None] * length
+        self._text = ""
+        self.text = text
+
+    @property
+    def text(self) -> str:
+        """The text shown, setting it redraws only the cells that change."""
+        return self._text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self._text = value
+        cells = self._cells
+        for index in range(self.length):
+            char = value[index] if index < len(value) else " "
+            if cells[index] != char:
+                self._draw_cell(index, char)
+                cells[index] = char
+
+    def invalidate(self) -> None:
+        """
+        Redraw every cell, for after something else drew over the widget.
+        """
+        self._cells = [None] * self.length
+        self.text = self._text
+
+    @property
+    def bounds(self) -> Tuple[int, int, int, int]:
+        """The area of the display the widget covers, ``(x, y, width, height)``."""
+        return (self.xpos, self.ypos, self.length * self.cell_width, self._font.font_height)
+
+    def _glyph(self, char: str) -> List[int]:
+        """Row masks of a character, bit 0 is its leftmost column"""
+        glyph = self._glyphs.get(char)
+        if glyph is None:
+            recorder = _GlyphRecorder(self._font.font_height)
+            self._font.draw_char(char, 0, 0, recorder, 1)
+            glyph = self._glyphs[char] = recorder.rows
+        return glyph
+
+    def _draw_cell(self, index: int, char: str) -> None:
+        """Clear a cell and draw a character in it, one row mask at a time"""
+        pixel_row = self._display.pixel_row
+        xpos = self.xpos + index * self.cell_width
+        width = self.cell_width
+        for row, mask in enumerate(self._glyph(char)):
+            pixel_row(self.ypos + row, mask, xpos=xpos, width=width)
@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+import board
+import digitalio
+
+from adafruit_max7219 import effects, matrices
+
+# You may need to change the chip select pin depending on your wiring
+spi = board.SPI()
+cs = digitalio.DigitalInOut(board.D4)
+
+matrix = matrices.CustomMatrix(spi, cs, 32, 8)
+matrix.text("Hey!", 4, 0)
+matrix.show()
+
+fader = effects.IntensityEffects(matrix, interval=0.05)
+while True:
+    # the frame is only sent once, effects just rewrite the intensity and shutdown registers
+    fader.fade(15, 0, 30)
+    while fader.update():
+        pass
+    fader.fade(0, 15, 30)
+    while fader.update():
+        pass
+    fader.blink(3, on_steps=6, off_steps=6)
+    while fader.update():
+        pass
+    # ripple the brightness along the chain
+    fader.fade_chips((15, 10, 5, 0), (0, 5, 10, 15), 20)
+    while fader.update():
+        pass
+    fader.fade_chips((0, 5, 10, 15), (15, 15, 15, 15), 20)
+    while fader.update():
+        pass
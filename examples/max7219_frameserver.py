@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Linux only: own the display and show frames sent by other processes
+# to /tmp/max7219.sock, printing frame statistics every few seconds.
+
+import time
+
+import board
+import digitalio
+
+from adafruit_max7219 import matrices
+from adafruit_max7219.streaming import FrameServer
+
+# You may need to change the chip select pin depending on your wiring
+spi = board.SPI()
+cs = digitalio.DigitalInOut(board.D4)
+
+matrix = matrices.CustomMatrix(spi, cs, 32, 8)
+matrix.init_display()
+
+server = FrameServer.unix(matrix, "/tmp/max7219.sock")
+print(f"Waiting for {server.frame_size} byte frames")
+last_report = time.monotonic()
+try:
+    while True:
+        server.poll(1.0)
+        if time.monotonic() - last_report > 5:
+            print(
+                f"shown {server.shown} dropped {server.dropped} errors {server.errors} "
+                f"show time {server.show_time * 1000:.2f} ms "
+                f"(max {server.max_show_time * 1000:.2f} ms)"
+            )
+            last_report = time.monotonic()
+finally:
+    server.deinit()
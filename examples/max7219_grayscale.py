@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+import time
+
+import board
+import digitalio
+
+from adafruit_max7219 import grayscale, matrices
+
+# You may need to change the chip select pin depending on your wiring
+spi = board.SPI()
+cs = digitalio.DigitalInOut(board.D4)
+
+matrix = matrices.CustomMatrix(spi, cs, 32, 8)
+canvas = grayscale.GrayscaleCanvas(matrix, bits=2)
+
+# a horizontal gradient through the four gray levels
+for x in range(canvas.width):
+    for y in range(canvas.height):
+        canvas.pixel(x, y, x * canvas.levels // canvas.width)
+canvas.update()
+
+last_report = time.monotonic()
+while True:
+    canvas.refresh()
+    if time.monotonic() - last_report > 5:
+        # lower plane_time if this drops too low and the display flickers, the
+        # display is dark while planes are sent, so long send times dim it
+        print(
+            f"Refresh rate: {canvas.refresh_rate:.1f} Hz, "
+            f"send time {canvas.send_time * 1000:.2f} ms per plane"
+        )
+        last_report = time.monotonic()
@@ -0,0 +1,26 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Measure the time and RAM each adafruit_max7219 module costs to import.
+# Run this on a freshly reset board, before anything else is imported.
+
+import gc
+import sys
+import time
+
+
+def measure(name):
+    gc.collect()
+    mem_before = gc.mem_free()
+    start = time.monotonic_ns()
+    __import__(name)
+    elapsed = time.monotonic_ns() - start
+    gc.collect()
+    used = mem_before - gc.mem_free()
+    print(f"{name}: {elapsed / 1000000:.1f} ms, {used} bytes")
+
+
+# BCDDigits must not pull in adafruit_framebuf
+measure("adafruit_max7219.bcddigits")
+measure("adafruit_max7219.matrices")
+print("adafruit_framebuf imported:", "adafruit_framebuf" in sys.modules)
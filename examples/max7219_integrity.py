@@ -0,0 +1,31 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+import time
+
+import board
+import digitalio
+
+from adafruit_max7219 import matrices
+from adafruit_max7219.integrity import IntegrityRefresh
+
+# You may need to change the chip select pin depending on your wiring
+spi = board.SPI()
+cs = digitalio.DigitalInOut(board.D4)
+
+matrix = matrices.CustomMatrix(spi, cs, 64, 8)
+matrix.init_display()
+matrix.brightness(4)
+matrix.text("steady", 0, 0)
+matrix.show()
+
+# resend one register and one digit row every 50ms, so a chip upset by
+# noise is fully repaired within about 0.8 seconds without any flashing
+refresh = IntegrityRefresh(matrix, interval=0.05)
+print("ticks to repair everything:", refresh.period)
+
+while True:
+    refresh.update()
+    if refresh.ticks and refresh.ticks % 1000 == 0:
+        print("resent", refresh.bytes_sent, "bytes")
+    time.sleep(0.01)
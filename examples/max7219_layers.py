@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+import time
+
+import board
+import digitalio
+
+from adafruit_max7219 import layers, matrices
+
+# You may need to change the chip select pin depending on your wiring
+spi = board.SPI()
+cs = digitalio.DigitalInOut(board.D4)
+
+matrix = matrices.CustomMatrix(spi, cs, 32, 8)
+compositor = layers.Compositor(matrix)
+
+# a dotted background, a counter and a bouncing ball on top of both
+background = layers.Layer(matrix.width, matrix.height, opaque=True)
+for x in range(0, matrix.width, 4):
+    background.pixel(x, 7, 1)
+counter = layers.TextLayer("0", x=20, y=0, z=1)
+ball = layers.Layer(2, 2, z=2)
+ball.fill(1)
+for layer in (background, counter, ball):
+    compositor.add(layer)
+
+x, y, dx, dy = 0, 0, 1, 1
+count = 0
+while True:
+    if not 0 <= x + dx <= matrix.width - ball.width:
+        dx = -dx
+        count += 1
+        counter.text = str(count % 100)
+    if not 0 <= y + dy <= matrix.height - ball.height:
+        dy = -dy
+    x += dx
+    y += dy
+    ball.move(x, y)
+    # only the rows the ball or the counter touched are recomposed and sent
+    compositor.render()
+    time.sleep(0.05)
@@ -0,0 +1,25 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Draw with Pillow on a Linux board (e.g. Raspberry Pi) and show the image.
+
+import board
+import digitalio
+from PIL import Image, ImageDraw
+
+from adafruit_max7219 import matrices
+
+# You may need to change the chip select pin depending on your wiring
+spi = board.SPI()
+cs = digitalio.DigitalInOut(board.D4)
+
+matrix = matrices.CustomMatrix(spi, cs, 32, 8)
+
+image = Image.new("1", (matrix.width, matrix.height))
+draw = ImageDraw.Draw(image)
+draw.ellipse((0, 0, 7, 7), outline=1)
+draw.line((10, 0, 17, 7), fill=1)
+draw.rectangle((20, 1, 30, 6), outline=1)
+
+matrix.image(image)
+matrix.show()
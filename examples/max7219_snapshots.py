@@ -0,0 +1,33 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+import time
+
+import board
+import digitalio
+
+from adafruit_max7219 import matrices
+
+# You may need to change the chip select pin depending on your wiring
+spi = board.SPI()
+cs = digitalio.DigitalInOut(board.D4)
+
+matrix = matrices.CustomMatrix(spi, cs, 32, 8)
+
+# draw each screen once and keep a copy of it
+IDLE, ALERT = 0, 1
+matrix.allocate_snapshots(2)
+matrix.clear_all()
+matrix.text("idle", 4, 0)
+matrix.snapshot(IDLE)
+matrix.clear_all()
+matrix.rect(0, 0, 32, 8, 1)
+matrix.text("!!", 10, 0)
+matrix.snapshot(ALERT)
+
+while True:
+    for screen in (IDLE, ALERT):
+        # copying a screen back only sends the digit rows that differ
+        matrix.restore(screen)
+        matrix.flush()
+        time.sleep(1)
@@ -0,0 +1,29 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+import time
+
+import board
+import digitalio
+
+from adafruit_max7219 import matrices, widgets
+
+# You may need to change the chip select pin depending on your wiring
+spi = board.SPI()
+cs = digitalio.DigitalInOut(board.D4)
+
+matrix = matrices.CustomMatrix(spi, cs, 32, 8)
+matrix.clear_all()
+matrix.show()
+
+# five cells of 6 pixels, mm:ss fits on a 32 pixel wide display
+clock = widgets.TextWidget(matrix, 1, 0, 5)
+
+start = time.monotonic()
+while True:
+    seconds = int(time.monotonic() - start)
+    # most seconds only the last digit changes, only its cell is redrawn. A glyph
+    # covers all 8 digit rows of this display, so flush() still sends every row
+    clock.text = f"{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+    matrix.flush()
+    time.sleep(0.1)
@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""batch() checked through a FakeTransport"""
+
+import pytest
+
+from adafruit_max7219 import matrices
+from adafruit_max7219.transports import FakeTransport
+
+_DECODEMODE = 9
+_INTENSITY = 10
+_SCANLIMIT = 11
+_SHUTDOWN = 12
+_DISPLAYTEST = 15
+CHIPS = 2
+
+
+def command(cmd, data):
+    return bytes([cmd, data] * CHIPS)
+
+
+def rows(display):
+    display._pack_rows()
+    return [bytes(row) for row in display._rows]
+
+
+@pytest.fixture
+def display():
+    return matrices.CustomMatrix(None, None, 8 * CHIPS, 8, transport=FakeTransport())
+
+
+def test_init_display_order(display):
+    with display.batch():
+        display.brightness(3)
+        display.init_display()
+    assert display._transport.transactions == 1
+    assert display._transport.messages == [
+        command(_INTENSITY, 3),
+        command(_SHUTDOWN, 0),
+        command(_DISPLAYTEST, 0),
+        command(_SCANLIMIT, 7),
+        command(_DECODEMODE, 0),
+        command(_SHUTDOWN, 1),
+        *rows(display),
+    ]
+
+
+def test_repeated_writes_merge_in_place(display):
+    display.show()
+    transport = display._transport
+    transport.clear()
+    with display.batch():
+        display.brightness(3)
+        display.pixel(0, 0, 1)
+        display.show()
+        display.brightness(7)
+        display.pixel(1, 0, 1)
+        display.show()
+    assert transport.transactions == 1
+    assert transport.messages == [command(_INTENSITY, 7), *rows(display)]
+
+
+def test_no_merging_across_shutdown(display):
+    display.show()
+    transport = display._transport
+    transport.clear()
+    with display.batch():
+        display.brightness(3)
+        display.write_cmd(_SHUTDOWN, 0)
+        display.brightness(7)
+        display.write_cmd(_SHUTDOWN, 1)
+        display.brightness(9)
+    assert transport.messages == [
+        command(_INTENSITY, 3),
+        command(_SHUTDOWN, 0),
+        command(_INTENSITY, 7),
+        command(_SHUTDOWN, 1),
+        command(_INTENSITY, 9),
+    ]
+
+
+def test_exception_drops_queue(display):
+    transport = display._transport
+    with pytest.raises(ValueError):
+        with display.batch():
+            display.pixel(0, 0, 1)
+            display.show()
+            raise ValueError("drawing failed")
+    assert not transport.messages
+    assert not display._configured
+    with display.batch():
+        display.flush()
+    assert transport.messages[0] == command(_SHUTDOWN, 0)
+    assert transport.messages[-8:] == rows(display)
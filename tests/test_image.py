@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""image() checked against pixel() through a FakeTransport"""
+
+import pytest
+
+from adafruit_max7219 import matrices
+from adafruit_max7219.transports import FakeTransport
+
+Image = pytest.importorskip("PIL.Image")
+
+POINTS = [(0, 0), (31, 7), (9, 3), (17, 6)]
+
+
+def custom_matrix(**kwargs):
+    transport = FakeTransport()
+    return matrices.CustomMatrix(None, None, 32, 8, transport=transport, **kwargs), transport
+
+
+@pytest.mark.parametrize("wire_layout", [False, True])
+def test_image_matches_pixel(wire_layout):
+    by_image, image_transport = custom_matrix(wire_layout=wire_layout)
+    by_pixel, pixel_transport = custom_matrix(wire_layout=wire_layout)
+    img = Image.new("1", (32, 8))
+    for x, y in POINTS:
+        img.putpixel((x, y), 1)
+        by_pixel.pixel(x, y, 1)
+    by_image.image(img)
+    by_image.show()
+    by_pixel.show()
+    assert image_transport.messages == pixel_transport.messages
+    assert any(message[1::2] != bytes(4) for message in image_transport.messages)
+
+
+def test_image_clears_previous_contents():
+    matrix, transport = custom_matrix()
+    matrix.fill(1)
+    matrix.image(Image.new("1", (32, 8)))
+    matrix.show()
+    assert all(message[1::2] == bytes(4) for message in transport.messages[-8:])
+
+
+def test_image_converts_mode():
+    by_image, image_transport = custom_matrix()
+    by_pixel, pixel_transport = custom_matrix()
+    img = Image.new("L", (32, 8))
+    img.putpixel((5, 2), 255)
+    by_pixel.pixel(5, 2, 1)
+    by_image.image(img)
+    by_image.show()
+    by_pixel.show()
+    assert image_transport.messages == pixel_transport.messages
+
+
+def test_image_follows_rotation():
+    by_image = matrices.Matrix8x8(None, None, transport=FakeTransport())
+    by_pixel = matrices.Matrix8x8(None, None, transport=FakeTransport())
+    by_image.framebuf.rotation = 1
+    by_pixel.framebuf.rotation = 1
+    img = Image.new("1", (8, 8))
+    img.putpixel((1, 6), 1)
+    by_image.image(img)
+    by_pixel.pixel(1, 6, 1)
+    assert bytes(by_image._buffer) == bytes(by_pixel._buffer)
+
+
+def test_image_size_mismatch():
+    matrix, _ = custom_matrix()
+    with pytest.raises(ValueError):
+        matrix.image(Image.new("1", (8, 8)))
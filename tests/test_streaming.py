@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""FrameServer checked with local sockets, a pipe and a FakeTransport"""
+
+import os
+import socket
+
+import pytest
+
+from adafruit_max7219 import matrices
+from adafruit_max7219.streaming import FrameServer
+from adafruit_max7219.transports import FakeTransport
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs UNIX sockets")
+
+
+@pytest.fixture
+def display():
+    matrix = matrices.CustomMatrix(None, None, 32, 8, transport=FakeTransport())
+    matrix.show()
+    matrix._transport.clear()
+    return matrix
+
+
+def make_frame(display, *points):
+    """A frame as show() would send it with the given pixels lit"""
+    display.fill(0)
+    for x, y in points:
+        display.pixel(x, y, 1)
+    display._pack_rows()
+    frame = bytes(display._frame)
+    display.fill(0)
+    display._pack_rows()
+    return frame
+
+
+def sent(display):
+    return b"".join(display._transport.messages)
+
+
+def test_unix_newest_frame_wins(display, tmp_path):
+    path = str(tmp_path / "frames.sock")
+    server = FrameServer.unix(display, path)
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    try:
+        frames = [make_frame(display, (x, 0)) for x in range(3)]
+        for frame in frames:
+            client.sendto(frame, path)
+        assert server.poll(1.0)
+        assert sent(display) == frames[-1]
+        assert (server.received, server.shown, server.dropped, server.errors) == (3, 1, 2, 0)
+    finally:
+        client.close()
+        server.deinit()
+    assert not os.path.exists(path)
+
+
+def test_udp_rejects_wrong_sizes_and_registers(display):
+    server = FrameServer.udp(display, 0)
+    address = server._source.getsockname()
+    client = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        frame = make_frame(display, (1, 1))
+        bad_registers = bytearray(frame)
+        bad_registers[0] = 0x0C
+        for datagram in (frame + b"junk", frame[:-1], bytes(bad_registers)):
+            client.sendto(datagram, address)
+        assert not server.poll(1.0)
+        assert server.errors == 3
+        assert server.received == 0
+        assert not display._transport.messages
+
+        client.sendto(frame, address)
+        assert server.poll(1.0)
+        assert sent(display) == frame
+        assert server.show_time >= 0
+    finally:
+        client.close()
+        server.deinit()
+
+
+def test_stream_reassembles_split_frames(display):
+    read_fd, write_fd = os.pipe()
+    source = os.fdopen(read_fd, "rb")
+    server = FrameServer.stream(display, source)
+    try:
+        frame = make_frame(display, (31, 7))
+        os.write(write_fd, frame[:10])
+        assert not server.poll(0.1)
+        os.write(write_fd, frame[10:])
+        assert server.poll(1.0)
+        assert sent(display) == frame
+        os.close(write_fd)
+        write_fd = None
+        server.serve_forever()
+        assert server.closed
+    finally:
+        if write_fd is not None:
+            os.close(write_fd)
+        server.deinit()
+        source.close()
+
+
+def test_stream_resyncs_after_stray_byte(display):
+    read_fd, write_fd = os.pipe()
+    source = os.fdopen(read_fd, "rb")
+    server = FrameServer.stream(display, source)
+    try:
+        first = make_frame(display, (0, 0))
+        second = make_frame(display, (5, 3))
+        os.write(write_fd, first + b"\x00" + second)
+        assert server.poll(1.0)
+        assert sent(display) == second
+        assert (server.received, server.errors) == (2, 1)
+
+        display._transport.clear()
+        os.write(write_fd, first)
+        assert server.poll(1.0)
+        assert sent(display) == first
+        assert server.errors == 1
+    finally:
+        os.close(write_fd)
+        server.deinit()
+        source.close()
+
+
+def test_stream_blocking_restored(display):
+    read_fd, write_fd = os.pipe()
+    source = os.fdopen(read_fd, "rb")
+    try:
+        server = FrameServer.stream(display, source)
+        assert not os.get_blocking(read_fd)
+        server.deinit()
+        assert os.get_blocking(read_fd)
+    finally:
+        os.close(write_fd)
+        source.close()